@@ -0,0 +1,227 @@
+import cv2
+import numpy as np
+import os
+import sys
+import time
+import random
+from multiprocessing import Process, resource_tracker, shared_memory
+
+# Constants
+width, height = 1280, 720
+fps = 60
+duration_seconds = 60 * 1  # Duration of the video in seconds
+min_brush_size, max_brush_size = 15, 60  # Variable brush size range
+
+# Calculate the total number of frames
+total_frames = fps * duration_seconds
+
+# Shared memory ring buffer settings
+ring_name = f"caleidoscopio_{os.getpid()}"  # Name other processes use to attach
+ring_slots = 8  # Number of frames the ring can hold before the writer waits
+num_readers = 1  # Number of consumer processes reading the ring
+reader_timeout = 5  # Seconds a reader may hold the writer back before it is detached
+frame_bytes = width * height * 3
+
+# Header layout (int64): ring slots, reader count, height, width, published frames,
+# closed flag, one cursor per reader, followed by the frame number stored in each slot.
+# The first four fields let a process that only knows the ring name find its geometry.
+meta_size = 6
+detached = -1  # Cursor value of a reader the writer stopped waiting for
+header_size = meta_size + num_readers + ring_slots
+header_bytes = header_size * 8
+
+# Center of the canvas
+cx, cy = width // 2, height // 2
+
+# Number of kaleidoscope segments
+num_segments = random.randint(3, 24)
+
+# Initialize smooth random parameters with smaller, controlled offsets
+random_a_offset = np.random.uniform(-5, 5)
+random_b_offset = np.random.uniform(-5, 5)
+random_rotation_offset = np.random.uniform(-0.02, 0.02)
+random_color_offset = np.random.uniform(-0.02, 0.02)
+
+# Function to create the ring buffer in shared memory
+def create_ring():
+    shm = shared_memory.SharedMemory(name=ring_name, create=True, size=header_bytes + ring_slots * frame_bytes)
+    header = np.ndarray((header_size,), dtype=np.int64, buffer=shm.buf)
+    header[:] = 0
+    header[:4] = ring_slots, num_readers, height, width
+    header[meta_size + num_readers:] = -1
+    return shm
+
+# Function to attach to an existing ring buffer from another process
+def open_ring(name):
+    if sys.version_info >= (3, 13):
+        shm = shared_memory.SharedMemory(name=name, track=False)
+    else:
+        # Before 3.13 attaching registers the segment with this process's resource
+        # tracker, which would unlink it under the writer when the reader exits
+        register = resource_tracker.register
+        resource_tracker.register = lambda name, rtype: None
+        try:
+            shm = shared_memory.SharedMemory(name=name)
+        finally:
+            resource_tracker.register = register
+
+    # Read the geometry the writer stored in the header
+    slot_count, reader_count, frame_height, frame_width = np.ndarray((4,), dtype=np.int64, buffer=shm.buf)
+    header = np.ndarray((meta_size + reader_count + slot_count,), dtype=np.int64, buffer=shm.buf)
+    slots = np.ndarray((slot_count, frame_height, frame_width, 3), dtype=np.uint8, buffer=shm.buf, offset=header.nbytes)
+    return shm, header, slots
+
+# Function to publish a frame, waiting while the slowest reader is a full ring behind.
+# A reader that makes no progress for reader_timeout seconds is detached and skipped.
+def publish_frame(header, slots, canvas, frame_number):
+    slot_count, reader_count = header[0], header[1]
+    cursors = header[meta_size:meta_size + reader_count]
+    sequence = header[4]
+    waiting_since = None
+    while True:
+        active = cursors[cursors != detached]
+        if len(active) == 0 or sequence - active.min() < slot_count:
+            break
+        if waiting_since is None:
+            waiting_since = time.time()
+        elif time.time() - waiting_since > reader_timeout:
+            for reader_index in np.flatnonzero((cursors != detached) & (sequence - cursors >= slot_count)):
+                cursors[reader_index] = detached
+                print(f"Reader {reader_index} stalled for {reader_timeout} seconds, detaching it")
+            break
+        time.sleep(0.0005)
+    slot = sequence % slot_count
+    slots[slot] = canvas
+    header[meta_size + reader_count + slot] = frame_number
+    header[4] = sequence + 1  # Publish only after the pixels are in place
+
+# Function to get the next frame for a reader as a view into shared memory (no copy)
+def acquire_frame(header, slots, reader_index):
+    slot_count, reader_count = header[0], header[1]
+    cursor = header[meta_size + reader_index]
+    if cursor == detached:
+        return None, None  # The writer stopped waiting for this reader
+    while header[4] <= cursor:
+        if header[5] and header[4] <= cursor:  # Closed flag is set after the last frame
+            return None, None
+        time.sleep(0.0005)
+    slot = cursor % slot_count
+    return header[meta_size + reader_count + slot], slots[slot]
+
+# Function to hand the slot back to the writer once the reader is done with the view
+def release_frame(header, reader_index):
+    cursor = header[meta_size + reader_index]
+    if cursor != detached:
+        header[meta_size + reader_index] = cursor + 1
+
+# Example consumer: reads every frame zero-copy and reports its average brightness
+def consumer(name, reader_index):
+    shm, header, slots = open_ring(name)
+    frames_read = 0
+    while True:
+        frame_number, frame = acquire_frame(header, slots, reader_index)
+        if frame is None:
+            break
+        if frame_number % fps == 0:
+            print(f"Reader {reader_index}: frame {frame_number}, mean brightness {frame.mean():.2f}")
+        frames_read += 1
+        del frame
+        release_frame(header, reader_index)
+    del header, slots
+    shm.close()
+    print(f"Reader {reader_index} finished after {frames_read} frames")
+
+# Function to calculate smooth color transition with controlled randomness
+def calculate_color(frame_number, random_offset):
+    r = int(np.clip((np.sin(frame_number * 0.02 + random_offset) + 1) * 127.5, 0, 255))
+    g = int(np.clip((np.sin(frame_number * 0.02 + 2 * np.pi / 3 + random_offset) + 1) * 127.5, 0, 255))
+    b = int(np.clip((np.sin(frame_number * 0.02 + 4 * np.pi / 3 + random_offset) + 1) * 127.5, 0, 255))
+    return (r, g, b)
+
+# Function to draw mirrored segments with smooth randomness
+def draw_mirrored_segments(x, y, canvas, color, brush_size):
+    for i in range(num_segments):
+        angle = i * (2 * np.pi / num_segments)
+        x_rot = int(np.cos(angle) * (x - cx) - np.sin(angle) * (y - cy) + cx)
+        y_rot = int(np.sin(angle) * (x - cx) + np.cos(angle) * (y - cy) + cy)
+        cv2.circle(canvas, (x_rot, y_rot), brush_size, color, -1)
+
+# Dampening function to slow down the motion over time
+def dampening_factor(frame_number):
+    return 1 - np.clip(frame_number / total_frames, 0, 0.9)
+
+if __name__ == "__main__":
+    # Create the ring and start the consumer processes
+    shm = create_ring()
+    header = np.ndarray((header_size,), dtype=np.int64, buffer=shm.buf)
+    slots = np.ndarray((ring_slots, height, width, 3), dtype=np.uint8, buffer=shm.buf, offset=header_bytes)
+    readers = [Process(target=consumer, args=(ring_name, i)) for i in range(num_readers)]
+    for reader in readers:
+        reader.start()
+
+    print(f"Publishing frames to shared memory ring '{ring_name}'")
+
+    # Initialize the canvas
+    canvas = np.zeros((height, width, 3), dtype=np.uint8)
+
+    # Start time of rendering
+    start_time = time.time()
+
+    for frame_number in range(total_frames):
+        # Apply dampening factor to slow down parameters over time
+        damp_factor = dampening_factor(frame_number)
+
+        # Smoothly vary elliptic parameters over time with added offsets
+        max_a = width * 0.2 * np.abs(np.sin(frame_number * 0.01 * damp_factor + random_a_offset))  # Adjusted semi-major axis
+        max_b = height * 0.1 + 25 * np.cos(frame_number * 0.01 * damp_factor + random_b_offset)  # Adjusted semi-minor axis
+        angle_variation = 0.015 * damp_factor + 0.001 * np.sin(frame_number * 0.005 * damp_factor)  # Smooth angle variation
+
+        a = max_a  # Keep the semi-major axis as is for maximum radius
+        b = max_b * np.abs(np.cos(frame_number * 0.01 * damp_factor))
+        angle = frame_number * angle_variation  # Angle with slight variation
+
+        # Calculate the position on the ellipse
+        x = int(cx + a * np.cos(angle))
+        y = int(cy + b * np.sin(angle))
+
+        # Rotate the ellipse around the center with smooth randomness
+        rotation_angle = frame_number * 0.01 * damp_factor + random_rotation_offset
+        x_rot = int(np.cos(rotation_angle) * (x - cx) - np.sin(rotation_angle) * (y - cy) + cx)
+        y_rot = int(np.sin(rotation_angle) * (x - cx) + np.cos(rotation_angle) * (y - cy) + cy)
+
+        # Calculate the color for this frame with smooth randomness
+        color = calculate_color(frame_number, random_color_offset)
+
+        # Smoothly randomize brush size within a controlled range
+        brush_size = int(min_brush_size + (max_brush_size - min_brush_size) * (0.5 + 0.5 * np.sin(frame_number * 0.01)))
+
+        # Draw the brush and its mirrored segments on the canvas
+        draw_mirrored_segments(x_rot, y_rot, canvas, color, brush_size)
+
+        # Publish the frame to the ring instead of writing a video file
+        publish_frame(header, slots, canvas, frame_number)
+
+        # Calculate statistics every second (every 'fps' frames)
+        if frame_number % fps == 0:
+            elapsed_time = time.time() - start_time
+            frames_remaining = total_frames - frame_number
+            time_remaining = (frames_remaining / fps) / 60  # In minutes
+            estimated_finish = time.time() + frames_remaining / fps
+            percentage_complete = (frame_number / total_frames) * 100
+
+            print(f"Time Elapsed: {elapsed_time:.2f} seconds")
+            print(f"Time Remaining: {time_remaining:.2f} minutes")
+            print(f"Estimated Time of Finish: {time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(estimated_finish))}")
+            print(f"Completion: {percentage_complete:.2f}%\n")
+
+    # Tell the readers no more frames are coming and wait for them to drain the ring
+    header[5] = 1
+    for reader in readers:
+        reader.join()
+
+    # Release the shared memory
+    del header, slots
+    shm.close()
+    shm.unlink()
+
+    print(f"Published {total_frames} frames to '{ring_name}'")
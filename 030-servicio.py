@@ -0,0 +1,308 @@
+import cv2
+import numpy as np
+import os
+import time
+import random
+import json
+import asyncio
+import threading
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+
+# Constants
+host, port = "127.0.0.1", 8080
+max_workers = max(1, os.cpu_count() // 2)  # Renders running at the same time
+results_directory = "render"
+min_brush_size, max_brush_size = 15, 60  # Variable brush size range
+
+# Presets: whether the canvas keeps the trail of previous frames
+presets = {
+    "orbita": {"trail": True},
+    "sin estela": {"trail": False},
+}
+
+# Default job parameters, overridden by the JSON body of each request
+default_job = {
+    "preset": "orbita",
+    "seed": None,
+    "width": 1280,
+    "height": 720,
+    "fps": 60,
+    "duration_seconds": 60,
+}
+
+# Functions to check the job parameters of a request
+def is_positive_integer(value):
+    return isinstance(value, int) and not isinstance(value, bool) and value > 0
+
+def is_positive_number(value):
+    return isinstance(value, (int, float)) and not isinstance(value, bool) and value > 0
+
+# Checks of the job parameters a request may set: (test, description)
+job_checks = {
+    "preset": (lambda value: isinstance(value, str) and value in presets, f"one of {list(presets)}"),
+    "seed": (lambda value: value is None or (isinstance(value, int) and not isinstance(value, bool)), "an integer or null"),
+    "width": (is_positive_integer, "a positive integer"),
+    "height": (is_positive_integer, "a positive integer"),
+    "fps": (is_positive_integer, "a positive integer"),
+    "duration_seconds": (is_positive_number, "a positive number"),
+}
+
+# Create a render directory if it doesn't exist
+os.makedirs(results_directory, exist_ok=True)
+
+# Function to calculate smooth color transition with controlled randomness
+def calculate_color(frame_number, random_offset):
+    r = int(np.clip((np.sin(frame_number * 0.02 + random_offset) + 1) * 127.5, 0, 255))
+    g = int(np.clip((np.sin(frame_number * 0.02 + 2 * np.pi / 3 + random_offset) + 1) * 127.5, 0, 255))
+    b = int(np.clip((np.sin(frame_number * 0.02 + 4 * np.pi / 3 + random_offset) + 1) * 127.5, 0, 255))
+    return (r, g, b)
+
+# Function to draw mirrored segments with smooth randomness
+def draw_mirrored_segments(x, y, canvas, color, brush_size, num_segments, cx, cy):
+    for i in range(num_segments):
+        angle = i * (2 * np.pi / num_segments)
+        x_rot = int(np.cos(angle) * (x - cx) - np.sin(angle) * (y - cy) + cx)
+        y_rot = int(np.sin(angle) * (x - cx) + np.cos(angle) * (y - cy) + cy)
+        cv2.circle(canvas, (x_rot, y_rot), brush_size, color, -1)
+
+# Function run in a worker process: renders one job and reports progress through a queue
+def render_job(job_id, job, filename, progress_queue, cancel_flags):
+    width, height, fps = job["width"], job["height"], job["fps"]
+    total_frames = int(fps * job["duration_seconds"])
+    cx, cy = width // 2, height // 2
+
+    # Seed both generators so a job can be reproduced
+    random.seed(job["seed"])
+    np.random.seed(job["seed"])
+    num_segments = random.randint(3, 24)
+    random_a_offset = np.random.uniform(-5, 5)
+    random_b_offset = np.random.uniform(-5, 5)
+    random_rotation_offset = np.random.uniform(-0.02, 0.02)
+    random_color_offset = np.random.uniform(-0.02, 0.02)
+
+    fourcc = cv2.VideoWriter_fourcc(*"mp4v")
+    out = cv2.VideoWriter(filename, fourcc, fps, (width, height))
+    canvas = np.zeros((height, width, 3), dtype=np.uint8)
+
+    for frame_number in range(total_frames):
+        # Clear the canvas for presets without trails
+        if not presets[job["preset"]]["trail"]:
+            canvas[:] = 0
+
+        damp_factor = 1 - np.clip(frame_number / total_frames, 0, 0.9)
+        max_a = width * 0.2 * np.abs(np.sin(frame_number * 0.01 * damp_factor + random_a_offset))
+        max_b = height * 0.1 + 25 * np.cos(frame_number * 0.01 * damp_factor + random_b_offset)
+        angle_variation = 0.015 * damp_factor + 0.001 * np.sin(frame_number * 0.005 * damp_factor)
+
+        a = max_a
+        b = max_b * np.abs(np.cos(frame_number * 0.01 * damp_factor))
+        angle = frame_number * angle_variation
+        x = int(cx + a * np.cos(angle))
+        y = int(cy + b * np.sin(angle))
+
+        rotation_angle = frame_number * 0.01 * damp_factor + random_rotation_offset
+        x_rot = int(np.cos(rotation_angle) * (x - cx) - np.sin(rotation_angle) * (y - cy) + cx)
+        y_rot = int(np.sin(rotation_angle) * (x - cx) + np.cos(rotation_angle) * (y - cy) + cy)
+
+        color = calculate_color(frame_number, random_color_offset)
+        brush_size = int(min_brush_size + (max_brush_size - min_brush_size) * (0.5 + 0.5 * np.sin(frame_number * 0.01)))
+        draw_mirrored_segments(x_rot, y_rot, canvas, color, brush_size, num_segments, cx, cy)
+
+        out.write(canvas)
+
+        # Report progress once per second of video and stop early if cancelled
+        if frame_number % fps == 0:
+            progress_queue.put((job_id, frame_number, total_frames))
+            if cancel_flags.get(job_id):
+                out.release()
+                os.remove(filename)
+                return "cancelled"
+
+    out.release()
+    progress_queue.put((job_id, total_frames, total_frames))
+    return "done"
+
+# Jobs known to the service and the SSE clients listening to each one
+jobs = {}
+listeners = {}
+
+# Function to send a status update to every SSE client of a job
+def notify(job_id):
+    for queue in listeners.get(job_id, []):
+        queue.put_nowait(dict(jobs[job_id]))
+
+# Function run in a thread: moves progress messages from the workers into the event loop
+def forward_progress(loop, progress_queue):
+    while True:
+        message = progress_queue.get()
+        if message is None:
+            break
+        loop.call_soon_threadsafe(apply_progress, *message)
+
+def apply_progress(job_id, frame_number, total_frames):
+    job = jobs[job_id]
+    if job["status"] in ("queued", "running"):
+        job["status"] = "running"  # The first report means a worker took the job
+        job["progress"] = round(frame_number / total_frames * 100, 2)
+        notify(job_id)
+
+# Function to build a job from a request body; returns (job, None) or (None, error)
+def validate_job(body):
+    if not isinstance(body, dict):
+        return None, "the body must be a JSON object"
+    job = dict(default_job)
+    for key, (check, description) in job_checks.items():
+        if key in body:
+            if not check(body[key]):
+                return None, f"{key} must be {description}"
+            job[key] = body[key]
+    if int(job["fps"] * job["duration_seconds"]) < 1:
+        return None, "fps * duration_seconds must give at least one frame"
+    return job, None
+
+# Function to submit a job to the process pool without blocking the event loop
+async def submit_job(pool, progress_queue, cancel_flags, job):
+    if job["seed"] is None:
+        job["seed"] = random.randint(0, 2**31 - 1)
+    job_id = f"{int(time.time())}-{len(jobs)}"
+    filename = os.path.join(results_directory, f"{job_id}.mp4")
+    jobs[job_id] = {"id": job_id, "status": "queued", "progress": 0.0, "job": job, "file": None}
+
+    loop = asyncio.get_running_loop()
+    future = loop.run_in_executor(pool, render_job, job_id, job, filename, progress_queue, cancel_flags)
+
+    async def wait_for_result():
+        try:
+            status = await future
+        except Exception as error:
+            jobs[job_id].update(status="failed", error=str(error))
+        else:
+            jobs[job_id]["status"] = status
+            if status == "done":
+                jobs[job_id].update(progress=100.0, file=f"/results/{job_id}.mp4")
+        notify(job_id)
+
+    asyncio.create_task(wait_for_result())
+    return jobs[job_id]
+
+# Functions to write HTTP responses
+async def send_response(writer, status, body, content_type="application/json"):
+    if not isinstance(body, bytes):
+        body = json.dumps(body).encode()
+    writer.write(f"HTTP/1.1 {status}\r\nContent-Type: {content_type}\r\nContent-Length: {len(body)}\r\nConnection: close\r\n\r\n".encode())
+    writer.write(body)
+    await writer.drain()
+
+async def send_file(writer, path):
+    size = os.path.getsize(path)
+    writer.write(f"HTTP/1.1 200 OK\r\nContent-Type: video/mp4\r\nContent-Length: {size}\r\nConnection: close\r\n\r\n".encode())
+    loop = asyncio.get_running_loop()
+    with open(path, "rb") as file:
+        while True:
+            chunk = await loop.run_in_executor(None, file.read, 1 << 20)
+            if not chunk:
+                break
+            writer.write(chunk)
+            await writer.drain()
+
+async def send_events(writer, job_id):
+    writer.write(b"HTTP/1.1 200 OK\r\nContent-Type: text/event-stream\r\nCache-Control: no-cache\r\nConnection: close\r\n\r\n")
+    queue = asyncio.Queue()
+    listeners.setdefault(job_id, []).append(queue)
+    try:
+        state = dict(jobs[job_id])
+        while True:
+            writer.write(f"data: {json.dumps(state)}\n\n".encode())
+            await writer.drain()
+            if state["status"] not in ("queued", "running"):
+                break
+            state = await queue.get()
+    finally:
+        listeners[job_id].remove(queue)
+
+# Function to handle one HTTP connection
+async def handle_client(reader, writer, pool, progress_queue, cancel_flags):
+    try:
+        request_line = (await reader.readline()).decode().split()
+        if len(request_line) < 2:
+            return
+        method, path = request_line[0], request_line[1]
+        headers = {}
+        while True:
+            line = (await reader.readline()).decode().strip()
+            if not line:
+                break
+            key, _, value = line.partition(":")
+            headers[key.strip().lower()] = value.strip()
+        content_length = headers.get("content-length", "0")
+        if not content_length.isdigit():
+            await send_response(writer, "400 Bad Request", {"error": "invalid Content-Length"})
+            return
+        body = await reader.readexactly(int(content_length))
+
+        parts = [part for part in path.split("/") if part]
+        if method == "POST" and parts == ["jobs"]:
+            try:
+                request = json.loads(body or b"{}")
+            except ValueError:
+                await send_response(writer, "400 Bad Request", {"error": "invalid JSON"})
+                return
+            job, error = validate_job(request)
+            if error:
+                await send_response(writer, "400 Bad Request", {"error": error})
+                return
+            await send_response(writer, "201 Created", await submit_job(pool, progress_queue, cancel_flags, job))
+        elif method == "GET" and parts == ["jobs"]:
+            await send_response(writer, "200 OK", list(jobs.values()))
+        elif len(parts) >= 2 and parts[0] == "jobs" and parts[1] not in jobs:
+            await send_response(writer, "404 Not Found", {"error": "unknown job"})
+        elif method == "GET" and len(parts) == 2 and parts[0] == "jobs":
+            await send_response(writer, "200 OK", jobs[parts[1]])
+        elif method == "GET" and len(parts) == 3 and parts[0] == "jobs" and parts[2] == "events":
+            await send_events(writer, parts[1])
+        elif method == "DELETE" and len(parts) == 2 and parts[0] == "jobs":
+            await asyncio.get_running_loop().run_in_executor(None, cancel_flags.__setitem__, parts[1], True)
+            await send_response(writer, "202 Accepted", jobs[parts[1]])
+        elif method == "GET" and len(parts) == 2 and parts[0] == "results":
+            path = os.path.join(results_directory, os.path.basename(parts[1]))
+            if os.path.isfile(path):
+                await send_file(writer, path)
+            else:
+                await send_response(writer, "404 Not Found", {"error": "unknown file"})
+        else:
+            await send_response(writer, "404 Not Found", {"error": "unknown endpoint"})
+    except (ConnectionError, asyncio.IncompleteReadError):
+        pass
+    finally:
+        writer.close()
+
+async def main():
+    manager = multiprocessing.Manager()
+    progress_queue = manager.Queue()
+    cancel_flags = manager.dict()
+    pool = ProcessPoolExecutor(max_workers=max_workers)
+
+    loop = asyncio.get_running_loop()
+    forwarder = threading.Thread(target=forward_progress, args=(loop, progress_queue), daemon=True)
+    forwarder.start()
+
+    server = await asyncio.start_server(
+        lambda reader, writer: handle_client(reader, writer, pool, progress_queue, cancel_flags), host, port
+    )
+    print(f"Render service listening on http://{host}:{port}")
+    print("POST /jobs, GET /jobs, GET /jobs/<id>, GET /jobs/<id>/events, DELETE /jobs/<id>, GET /results/<file>")
+
+    try:
+        async with server:
+            await server.serve_forever()
+    finally:
+        progress_queue.put(None)
+        pool.shutdown(cancel_futures=True)
+        manager.shutdown()
+
+if __name__ == "__main__":
+    try:
+        asyncio.run(main())
+    except KeyboardInterrupt:
+        print("Render service stopped")
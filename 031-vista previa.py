@@ -0,0 +1,203 @@
+import cv2
+import numpy as np
+import os
+import time
+import random
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# Constants
+width, height = 3840, 2160
+fps = 60
+duration_seconds = 60 * 60  # Duration of the video in seconds
+min_brush_size, max_brush_size = 15, 60  # Variable brush size range
+
+# Preview settings
+preview_host, preview_port = "127.0.0.1", 8081
+preview_every = 30  # Offer every Nth frame to the preview thread
+preview_width = 640  # Width of the preview image, height keeps the aspect ratio
+preview_quality = 70  # JPEG quality of the preview
+preview_max_cpu_share = 0.03  # Fraction of one core the preview thread may use
+
+# Calculate the total number of frames
+total_frames = fps * duration_seconds
+
+# Create a render directory if it doesn't exist
+os.makedirs("render", exist_ok=True)
+
+# Generate the filename using the current epoch time
+filename = f"render/{int(time.time())}.mp4"
+
+# Create a VideoWriter object
+fourcc = cv2.VideoWriter_fourcc(*"mp4v")
+out = cv2.VideoWriter(filename, fourcc, fps, (width, height))
+
+# Center of the canvas
+cx, cy = width // 2, height // 2
+
+# Initialize the canvas
+canvas = np.zeros((height, width, 3), dtype=np.uint8)
+
+# Number of kaleidoscope segments
+num_segments = random.randint(3, 24)
+
+# Initialize smooth random parameters with smaller, controlled offsets
+random_a_offset = np.random.uniform(-5, 5)
+random_b_offset = np.random.uniform(-5, 5)
+random_rotation_offset = np.random.uniform(-0.02, 0.02)
+random_color_offset = np.random.uniform(-0.02, 0.02)
+
+# Shared state between the render loop, the preview thread and the HTTP clients
+preview_frame = np.empty_like(canvas)  # Snapshot handed to the preview thread
+preview_pending = threading.Event()  # Set while the snapshot waits to be encoded
+preview_condition = threading.Condition()
+preview_jpeg = None  # Latest encoded preview
+preview_clients = 0  # Connected viewers; no snapshots are taken while zero
+preview_stop = threading.Event()
+
+# Function run in a side thread: downscales and encodes snapshots within the CPU budget
+def preview_worker():
+    global preview_jpeg
+    preview_height = preview_width * height // width
+
+    # time.thread_time() only counts this thread, so keep cv2.resize from fanning
+    # out to OpenCV's worker threads. The setting is process-wide, but the render
+    # loop only draws circles and encodes, which do not use that pool.
+    cv2.setNumThreads(1)
+    while not preview_stop.is_set():
+        if not preview_pending.wait(timeout=0.5):
+            continue
+        work_start = time.thread_time()
+        small = cv2.resize(preview_frame, (preview_width, preview_height), interpolation=cv2.INTER_AREA)
+        preview_pending.clear()  # The snapshot buffer can be reused now
+        encoded, jpeg = cv2.imencode(".jpg", small, [cv2.IMWRITE_JPEG_QUALITY, preview_quality])
+        work_time = time.thread_time() - work_start
+        if encoded:
+            with preview_condition:
+                preview_jpeg = jpeg.tobytes()
+                preview_condition.notify_all()
+        # Sleep long enough that the work stays under the CPU share
+        time.sleep(work_time * (1 / preview_max_cpu_share - 1))
+
+# HTTP handler that serves the preview as an MJPEG stream
+class PreviewHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        global preview_clients
+        if self.path != "/":
+            self.send_error(404)
+            return
+        self.send_response(200)
+        self.send_header("Content-Type", "multipart/x-mixed-replace; boundary=frame")
+        self.send_header("Cache-Control", "no-cache")
+        self.end_headers()
+        with preview_condition:
+            preview_clients += 1
+        try:
+            while not preview_stop.is_set():
+                with preview_condition:
+                    preview_condition.wait(timeout=1)
+                    jpeg = preview_jpeg
+                if jpeg is None:
+                    continue
+                self.wfile.write(b"--frame\r\nContent-Type: image/jpeg\r\n")
+                self.wfile.write(f"Content-Length: {len(jpeg)}\r\n\r\n".encode())
+                self.wfile.write(jpeg + b"\r\n")
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+        finally:
+            with preview_condition:
+                preview_clients -= 1
+
+    def log_message(self, format, *args):
+        pass
+
+# Function to calculate smooth color transition with controlled randomness
+def calculate_color(frame_number, random_offset):
+    r = int(np.clip((np.sin(frame_number * 0.02 + random_offset) + 1) * 127.5, 0, 255))
+    g = int(np.clip((np.sin(frame_number * 0.02 + 2 * np.pi / 3 + random_offset) + 1) * 127.5, 0, 255))
+    b = int(np.clip((np.sin(frame_number * 0.02 + 4 * np.pi / 3 + random_offset) + 1) * 127.5, 0, 255))
+    return (r, g, b)
+
+# Function to draw mirrored segments with smooth randomness
+def draw_mirrored_segments(x, y, canvas, color, brush_size):
+    for i in range(num_segments):
+        angle = i * (2 * np.pi / num_segments)
+        x_rot = int(np.cos(angle) * (x - cx) - np.sin(angle) * (y - cy) + cx)
+        y_rot = int(np.sin(angle) * (x - cx) + np.cos(angle) * (y - cy) + cy)
+        cv2.circle(canvas, (x_rot, y_rot), brush_size, color, -1)
+
+# Dampening function to slow down the motion over time
+def dampening_factor(frame_number):
+    return 1 - np.clip(frame_number / total_frames, 0, 0.9)
+
+# Start the preview thread and the MJPEG server
+preview_thread = threading.Thread(target=preview_worker, daemon=True)
+preview_thread.start()
+preview_server = ThreadingHTTPServer((preview_host, preview_port), PreviewHandler)
+preview_server.daemon_threads = True
+threading.Thread(target=preview_server.serve_forever, daemon=True).start()
+print(f"Live preview at http://{preview_host}:{preview_port}/")
+
+# Start time of rendering
+start_time = time.time()
+
+for frame_number in range(total_frames):
+    # Apply dampening factor to slow down parameters over time
+    damp_factor = dampening_factor(frame_number)
+
+    # Linearly interpolate max_a from 0.2 to 0.6 of the screen width over the duration of the video
+    max_a = width * (0.2 + (0.6 - 0.2) * (frame_number / total_frames))  # Adjusted semi-major axis
+    max_b = height * 0.1 + 25 * np.cos(frame_number * 0.01 * damp_factor + random_b_offset)  # Adjusted semi-minor axis
+    angle_variation = 0.015 * damp_factor + 0.001 * np.sin(frame_number * 0.005 * damp_factor)  # Smooth angle variation
+
+    a = max_a  # Keep the semi-major axis as is for maximum radius
+    b = max_b * np.abs(np.cos(frame_number * 0.01 * damp_factor))
+    angle = frame_number * angle_variation  # Angle with slight variation
+
+    # Calculate the position on the ellipse
+    x = int(cx + a * np.cos(angle))
+    y = int(cy + b * np.sin(angle))
+
+    # Rotate the ellipse around the center with smooth randomness
+    rotation_angle = frame_number * 0.01 * damp_factor + random_rotation_offset
+    x_rot = int(np.cos(rotation_angle) * (x - cx) - np.sin(rotation_angle) * (y - cy) + cx)
+    y_rot = int(np.sin(rotation_angle) * (x - cx) + np.cos(rotation_angle) * (y - cy) + cy)
+
+    # Calculate the color for this frame with smooth randomness
+    color = calculate_color(frame_number, random_color_offset)
+
+    # Smoothly randomize brush size within a controlled range
+    brush_size = int(min_brush_size + (max_brush_size - min_brush_size) * (0.5 + 0.5 * np.sin(frame_number * 0.01)))
+
+    # Draw the brush and its mirrored segments on the canvas
+    draw_mirrored_segments(x_rot, y_rot, canvas, color, brush_size)
+
+    # Write the frame to the video file
+    out.write(canvas)
+
+    # Hand a snapshot to the preview thread only if someone is watching and it is idle
+    if frame_number % preview_every == 0 and preview_clients and not preview_pending.is_set():
+        np.copyto(preview_frame, canvas)
+        preview_pending.set()
+
+    # Calculate statistics every second (every 'fps' frames)
+    if frame_number % fps == 0:
+        elapsed_time = time.time() - start_time
+        frames_remaining = total_frames - frame_number
+        time_remaining = (frames_remaining / fps) / 60  # In minutes
+        estimated_finish = time.time() + frames_remaining / fps
+        percentage_complete = (frame_number / total_frames) * 100
+
+        print(f"Time Elapsed: {elapsed_time:.2f} seconds")
+        print(f"Time Remaining: {time_remaining:.2f} minutes")
+        print(f"Estimated Time of Finish: {time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(estimated_finish))}")
+        print(f"Completion: {percentage_complete:.2f}%\n")
+
+# Release the VideoWriter object
+out.release()
+
+# Stop the preview
+preview_stop.set()
+preview_server.shutdown()
+
+print(f"Video saved as {filename}")
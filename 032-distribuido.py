@@ -0,0 +1,312 @@
+import cv2
+import numpy as np
+import os
+import sys
+import time
+import random
+import json
+import shutil
+import socket
+import subprocess
+import threading
+import socketserver
+from multiprocessing import Process
+
+# Constants
+width, height = 1280, 720
+fps = 60
+duration_seconds = 60 * 1  # Duration of the video in seconds
+min_brush_size, max_brush_size = 15, 60  # Variable brush size range
+
+# Distribution settings
+coordinator_host, coordinator_port = "127.0.0.1", 8082  # Address workers connect to by default
+bind_host = "0.0.0.0"  # Address the coordinator listens on, all interfaces so other machines can connect
+frames_per_range = fps * 10  # Frames in each leased range
+lease_seconds = 30  # A range goes back to the queue if its worker is silent this long
+heartbeat_seconds = 5  # How often a worker renews its lease
+local_workers = 4  # Workers started by the "local" mode
+max_upload_bytes = 1 << 30  # Largest segment the coordinator accepts; it listens unauthenticated
+
+# Calculate the total number of frames
+total_frames = fps * duration_seconds
+
+# Create a render directory if it doesn't exist
+os.makedirs("render", exist_ok=True)
+
+# Function to calculate smooth color transition with controlled randomness
+def calculate_color(frame_number, random_offset):
+    r = int(np.clip((np.sin(frame_number * 0.02 + random_offset) + 1) * 127.5, 0, 255))
+    g = int(np.clip((np.sin(frame_number * 0.02 + 2 * np.pi / 3 + random_offset) + 1) * 127.5, 0, 255))
+    b = int(np.clip((np.sin(frame_number * 0.02 + 4 * np.pi / 3 + random_offset) + 1) * 127.5, 0, 255))
+    return (r, g, b)
+
+# Function to draw mirrored segments with squares rotating around their centers
+def draw_mirrored_segments(x, y, canvas, color, brush_size, rotation_angle, job):
+    cx, cy, num_segments = job["width"] // 2, job["height"] // 2, job["num_segments"]
+    for i in range(num_segments):
+        angle = i * (2 * np.pi / num_segments)
+        x_rot = int(np.cos(angle) * (x - cx) - np.sin(angle) * (y - cy) + cx)
+        y_rot = int(np.sin(angle) * (x - cx) + np.cos(angle) * (y - cy) + cy)
+
+        # Create the square's rotation matrix
+        rotation_matrix = cv2.getRotationMatrix2D((x_rot, y_rot), rotation_angle, 1)
+        half_size = brush_size // 2
+        square_pts = np.array([
+            [x_rot - half_size, y_rot - half_size],
+            [x_rot + half_size, y_rot - half_size],
+            [x_rot + half_size, y_rot + half_size],
+            [x_rot - half_size, y_rot + half_size]
+        ])
+        rotated_square = cv2.transform(np.array([square_pts]), rotation_matrix)[0]
+
+        # Draw the rotated square
+        cv2.fillPoly(canvas, [np.int32(rotated_square)], color)
+
+# Function to render one frame of the 021 piece; frames do not depend on each other
+def render_frame(frame_number, job):
+    width, height, total_frames = job["width"], job["height"], job["total_frames"]
+    cx, cy = width // 2, height // 2
+    canvas = np.zeros((height, width, 3), dtype=np.uint8)
+    damp_factor = 1 - np.clip(frame_number / total_frames, 0, 0.9)
+
+    for brush_index in range(job["num_brushes"]):
+        max_a = width * 0.6 * np.abs(np.sin(frame_number * 0.01 * damp_factor + job["random_a_offset"] + brush_index))
+        max_b = height * 0.1 + 25 * np.cos(frame_number * 0.01 * damp_factor + job["random_b_offset"] + brush_index)
+        angle_variation = 0.015 * damp_factor + 0.001 * np.sin(frame_number * 0.005 * damp_factor)
+
+        a = max_a
+        b = max_b * np.abs(np.cos(frame_number * 0.01 * damp_factor + brush_index))
+        angle = frame_number * angle_variation + brush_index
+        x = int(cx + a * np.cos(angle))
+        y = int(cy + b * np.sin(angle))
+
+        rotation_angle = frame_number * 0.01 * damp_factor + job["random_rotation_offset"] + brush_index
+        color = calculate_color(frame_number + brush_index * 100, job["random_color_offset"])
+        brush_size = int(min_brush_size + (max_brush_size - min_brush_size) * (0.5 + 0.5 * np.sin(frame_number * 0.01 + brush_index)))
+        brush_size *= 5
+
+        draw_mirrored_segments(x, y, canvas, color, brush_size, rotation_angle, job)
+
+    return canvas
+
+# Functions to exchange newline-terminated JSON messages over a socket
+def send_message(sock_file, message):
+    sock_file.write(json.dumps(message).encode() + b"\n")
+    sock_file.flush()
+
+def receive_message(sock_file):
+    line = sock_file.readline()
+    return json.loads(line) if line else None
+
+# Coordinator state: ranges waiting, leased and finished
+class Coordinator:
+    def __init__(self, job, segment_directory):
+        self.job = job
+        self.segment_directory = segment_directory
+        self.pending = [(start, min(start + frames_per_range, job["total_frames"])) for start in range(0, job["total_frames"], frames_per_range)]
+        self.range_count = len(self.pending)
+        self.leases = {}  # lease_id -> (range, expiry time)
+        self.finished = {}  # range start -> segment path
+        self.next_lease = 0
+        self.lock = threading.Lock()
+        self.all_done = threading.Event()
+
+    def reclaim_expired(self):
+        now = time.time()
+        for lease_id, (frame_range, expiry) in list(self.leases.items()):
+            if expiry < now:
+                print(f"Lease {lease_id} for frames {frame_range} expired, re-queueing")
+                del self.leases[lease_id]
+                self.pending.append(frame_range)
+
+    def lease(self):
+        with self.lock:
+            self.reclaim_expired()
+            if len(self.finished) == self.range_count:
+                return {"type": "done"}
+            if not self.pending:
+                return {"type": "wait", "seconds": 1}
+            frame_range = self.pending.pop(0)
+            lease_id = self.next_lease
+            self.next_lease += 1
+            self.leases[lease_id] = (frame_range, time.time() + lease_seconds)
+            return {"type": "range", "lease_id": lease_id, "range": frame_range, "job": self.job}
+
+    def heartbeat(self, lease_id):
+        with self.lock:
+            if lease_id not in self.leases:
+                return False
+            frame_range, _ = self.leases[lease_id]
+            self.leases[lease_id] = (frame_range, time.time() + lease_seconds)
+            return True
+
+    def complete(self, lease_id, data):
+        with self.lock:
+            if lease_id not in self.leases:
+                return False  # Lease expired and was handed to another worker
+            frame_range, _ = self.leases.pop(lease_id)
+            path = os.path.join(self.segment_directory, f"{frame_range[0]:08d}.mp4")
+            with open(path, "wb") as segment:
+                segment.write(data)
+            self.finished[frame_range[0]] = path
+            print(f"Frames {frame_range[0]}-{frame_range[1]} received ({len(self.finished)} segments)")
+            if len(self.finished) == self.range_count:
+                self.all_done.set()
+            return True
+
+# Handler for one worker connection
+class CoordinatorHandler(socketserver.StreamRequestHandler):
+    def handle(self):
+        coordinator = self.server.coordinator
+        try:
+            while True:
+                message = receive_message(self.rfile)
+                if message is None:
+                    break
+                if message["type"] == "lease":
+                    send_message(self.wfile, coordinator.lease())
+                elif message["type"] == "heartbeat":
+                    send_message(self.wfile, {"type": "ok" if coordinator.heartbeat(message["lease_id"]) else "lost"})
+                elif message["type"] == "upload":
+                    size = message["size"]
+                    if not isinstance(size, int) or not 0 < size <= max_upload_bytes:
+                        break  # Refuse the upload; the lease expires and the range is re-queued
+                    data = self.rfile.read(size)
+                    if len(data) < size:
+                        break  # Worker died mid-upload, its lease will expire
+                    send_message(self.wfile, {"type": "ok" if coordinator.complete(message["lease_id"], data) else "lost"})
+        except ConnectionError:
+            pass  # The lease of a dead worker expires and its range is re-queued
+
+# Function to join the segments in frame order into the final video
+def join_segments(paths, filename):
+    if shutil.which("ffmpeg"):
+        list_path = filename + ".txt"
+        with open(list_path, "w") as listing:
+            for path in paths:
+                listing.write(f"file '{os.path.abspath(path)}'\n")
+        subprocess.run(["ffmpeg", "-y", "-loglevel", "error", "-f", "concat", "-safe", "0", "-i", list_path, "-c", "copy", filename], check=True)
+        os.remove(list_path)
+        return
+
+    # Without ffmpeg, decode the segments and write them again
+    fourcc = cv2.VideoWriter_fourcc(*"mp4v")
+    out = cv2.VideoWriter(filename, fourcc, fps, (width, height))
+    for path in paths:
+        capture = cv2.VideoCapture(path)
+        while True:
+            ok, frame = capture.read()
+            if not ok:
+                break
+            out.write(frame)
+        capture.release()
+    out.release()
+
+def run_coordinator(bind_address=bind_host):
+    # Pick the random parameters once so every worker renders the same piece
+    job = {
+        "width": width,
+        "height": height,
+        "fps": fps,
+        "total_frames": total_frames,
+        "num_segments": random.randint(3, 24),
+        "num_brushes": 25,
+        "random_a_offset": np.random.uniform(-5, 5),
+        "random_b_offset": np.random.uniform(-5, 5),
+        "random_rotation_offset": np.random.uniform(-0.02, 0.02),
+        "random_color_offset": np.random.uniform(-0.02, 0.02),
+    }
+    epoch = int(time.time())
+    segment_directory = f"render/{epoch}_segments"
+    os.makedirs(segment_directory, exist_ok=True)
+
+    coordinator = Coordinator(job, segment_directory)
+    socketserver.ThreadingTCPServer.allow_reuse_address = True
+    server = socketserver.ThreadingTCPServer((bind_address, coordinator_port), CoordinatorHandler)
+    server.daemon_threads = True
+    server.coordinator = coordinator
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    print(f"Coordinator listening on {bind_address}:{coordinator_port}, {len(coordinator.pending)} ranges to render")
+
+    start_time = time.time()
+    while not coordinator.all_done.wait(timeout=1):
+        with coordinator.lock:
+            coordinator.reclaim_expired()
+
+    # Give workers a moment to receive "done" before closing the server
+    time.sleep(heartbeat_seconds)
+    server.shutdown()
+
+    filename = f"render/{epoch}.mp4"
+    join_segments([coordinator.finished[start] for start in sorted(coordinator.finished)], filename)
+    shutil.rmtree(segment_directory)
+    print(f"Rendered in {time.time() - start_time:.2f} seconds")
+    print(f"Video saved as {filename}")
+
+# Function run in a thread while a worker renders, to keep its lease alive
+def keep_lease(host, port, lease_id, stop):
+    with socket.create_connection((host, port)) as sock:
+        sock_file = sock.makefile("rwb")
+        while not stop.wait(heartbeat_seconds):
+            send_message(sock_file, {"type": "heartbeat", "lease_id": lease_id})
+            reply = receive_message(sock_file)
+            if reply is None or reply["type"] == "lost":
+                break
+
+def run_worker(host, port, worker_name):
+    with socket.create_connection((host, port)) as sock:
+        sock_file = sock.makefile("rwb")
+        while True:
+            send_message(sock_file, {"type": "lease"})
+            reply = receive_message(sock_file)
+            if reply is None or reply["type"] == "done":
+                break
+            if reply["type"] == "wait":
+                time.sleep(reply["seconds"])
+                continue
+
+            lease_id, (start, end), job = reply["lease_id"], reply["range"], reply["job"]
+            stop = threading.Event()
+            threading.Thread(target=keep_lease, args=(host, port, lease_id, stop), daemon=True).start()
+
+            # Render the range into a local segment file
+            segment_path = f"render/worker_{worker_name}_{lease_id}.mp4"
+            fourcc = cv2.VideoWriter_fourcc(*"mp4v")
+            out = cv2.VideoWriter(segment_path, fourcc, job["fps"], (job["width"], job["height"]))
+            for frame_number in range(start, end):
+                out.write(render_frame(frame_number, job))
+            out.release()
+            stop.set()
+
+            # Upload the segment to the coordinator
+            with open(segment_path, "rb") as segment:
+                data = segment.read()
+            os.remove(segment_path)
+            send_message(sock_file, {"type": "upload", "lease_id": lease_id, "size": len(data)})
+            sock_file.write(data)
+            sock_file.flush()
+            reply = receive_message(sock_file)
+            if reply is None:
+                break  # The coordinator closed the connection
+            status = reply["type"]
+            print(f"Worker {worker_name}: frames {start}-{end} uploaded ({status})")
+
+if __name__ == "__main__":
+    # Usage: coordinator [bind address] | worker [coordinator host] | local [workers]
+    mode = sys.argv[1] if len(sys.argv) > 1 else "local"
+    if mode == "coordinator":
+        run_coordinator(sys.argv[2] if len(sys.argv) > 2 else bind_host)
+    elif mode == "worker":
+        run_worker(sys.argv[2] if len(sys.argv) > 2 else coordinator_host, coordinator_port, f"{socket.gethostname()}_{os.getpid()}")
+    else:
+        # Coordinator plus several workers on this machine, for testing the whole flow
+        count = int(sys.argv[2]) if len(sys.argv) > 2 else local_workers
+        workers = [Process(target=run_worker, args=(coordinator_host, coordinator_port, str(i))) for i in range(count)]
+        coordinator_process = Process(target=run_coordinator, args=(coordinator_host,))
+        coordinator_process.start()
+        time.sleep(1)
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+        coordinator_process.join()
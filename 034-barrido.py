@@ -0,0 +1,145 @@
+import cv2
+import numpy as np
+import os
+import time
+import itertools
+from concurrent.futures import ProcessPoolExecutor
+
+# Constants
+width, height = 1280, 720  # Full size the piece is designed for
+fps = 60
+duration_seconds = 60 * 1  # Duration of the video in seconds
+min_brush_size, max_brush_size = 15, 60  # Variable brush size range
+
+# Sweep settings: every combination of these values is rendered
+sweep = {
+    "num_segments": [3, 5, 6, 8, 12, 24],
+    "random_a_offset": [-4.0, -2.0, 0.0, 2.0, 4.0],
+    "seed": [1, 2, 3, 4, 5, 6, 7],
+}
+thumb_width, thumb_height = 192, 108  # Size each variant is rendered at
+sheet_columns, sheet_rows = 8, 6  # Thumbnails per contact sheet
+strip_frames = 90  # Frames kept for the animated strips
+label_color = (255, 255, 255)
+
+# Calculate the total number of frames
+total_frames = fps * duration_seconds
+
+# Create a render directory if it doesn't exist
+os.makedirs("render", exist_ok=True)
+
+# Generate the filenames using the current epoch time
+epoch = int(time.time())
+
+# Function to calculate smooth color transition with controlled randomness
+def calculate_color(frame_number, random_offset):
+    r = int(np.clip((np.sin(frame_number * 0.02 + random_offset) + 1) * 127.5, 0, 255))
+    g = int(np.clip((np.sin(frame_number * 0.02 + 2 * np.pi / 3 + random_offset) + 1) * 127.5, 0, 255))
+    b = int(np.clip((np.sin(frame_number * 0.02 + 4 * np.pi / 3 + random_offset) + 1) * 127.5, 0, 255))
+    return (r, g, b)
+
+# Function to draw mirrored segments with smooth randomness
+def draw_mirrored_segments(x, y, canvas, color, brush_size, num_segments, cx, cy):
+    for i in range(num_segments):
+        angle = i * (2 * np.pi / num_segments)
+        x_rot = int(np.cos(angle) * (x - cx) - np.sin(angle) * (y - cy) + cx)
+        y_rot = int(np.sin(angle) * (x - cx) + np.cos(angle) * (y - cy) + cy)
+        cv2.circle(canvas, (x_rot, y_rot), brush_size, color, -1)
+
+# Dampening function to slow down the motion over time
+def dampening_factor(frame_number):
+    return 1 - np.clip(frame_number / total_frames, 0, 0.9)
+
+# Function run in a worker process: renders one variant of 024 at thumbnail size
+def render_variant(variant):
+    # The remaining offsets come from the seed, as in the full-size piece
+    np.random.seed(variant["seed"])
+    np.random.uniform(-5, 5)  # Keep the draw order of random_a_offset
+    random_b_offset = np.random.uniform(-5, 5)
+    random_rotation_offset = np.random.uniform(-0.02, 0.02)
+    random_color_offset = np.random.uniform(-0.02, 0.02)
+    num_segments = variant["num_segments"]
+    random_a_offset = variant["random_a_offset"]
+
+    # Geometry is relative to the frame size, brush sizes scale with it
+    scale = thumb_width / width
+    cx, cy = thumb_width // 2, thumb_height // 2
+    canvas = np.zeros((thumb_height, thumb_width, 3), dtype=np.uint8)
+    strip = np.empty((strip_frames, thumb_height, thumb_width, 3), dtype=np.uint8)
+    strip_every = max(1, total_frames // strip_frames)
+
+    for frame_number in range(total_frames):
+        damp_factor = dampening_factor(frame_number)
+        max_a = thumb_width * 0.2 * np.abs(np.sin(frame_number * 0.01 * damp_factor + random_a_offset))
+        max_b = thumb_height * 0.1 + 25 * scale * np.cos(frame_number * 0.01 * damp_factor + random_b_offset)
+        angle_variation = 0.015 * damp_factor + 0.001 * np.sin(frame_number * 0.005 * damp_factor)
+
+        a = max_a
+        b = max_b * np.abs(np.cos(frame_number * 0.01 * damp_factor))
+        angle = frame_number * angle_variation
+        x = int(cx + a * np.cos(angle))
+        y = int(cy + b * np.sin(angle))
+
+        rotation_angle = frame_number * 0.01 * damp_factor + random_rotation_offset
+        x_rot = int(np.cos(rotation_angle) * (x - cx) - np.sin(rotation_angle) * (y - cy) + cx)
+        y_rot = int(np.sin(rotation_angle) * (x - cx) + np.cos(rotation_angle) * (y - cy) + cy)
+
+        color = calculate_color(frame_number, random_color_offset)
+        brush_size = int(min_brush_size + (max_brush_size - min_brush_size) * (0.5 + 0.5 * np.sin(frame_number * 0.01)))
+        draw_mirrored_segments(x_rot, y_rot, canvas, color, max(1, int(brush_size * scale)), num_segments, cx, cy)
+
+        if frame_number % strip_every == 0 and frame_number // strip_every < strip_frames:
+            strip[frame_number // strip_every] = canvas
+
+    # Pad the strip with the last frame if the piece is shorter than the strip
+    filled = min(strip_frames, (total_frames - 1) // strip_every + 1)
+    strip[filled:] = canvas
+    return canvas, strip
+
+# Function to write the label of a variant on its thumbnail
+def label(image, variant):
+    text = f"s{variant['num_segments']} a{variant['random_a_offset']:+.1f} #{variant['seed']}"
+    cv2.putText(image, text, (3, thumb_height - 5), cv2.FONT_HERSHEY_PLAIN, 0.8, label_color, 1, cv2.LINE_AA)
+    return image
+
+# Function to tile a page of thumbnails into one image
+def tile(images):
+    sheet = np.zeros((sheet_rows * thumb_height, sheet_columns * thumb_width, 3), dtype=np.uint8)
+    for index, image in enumerate(images):
+        row, column = divmod(index, sheet_columns)
+        sheet[row * thumb_height:(row + 1) * thumb_height, column * thumb_width:(column + 1) * thumb_width] = image
+    return sheet
+
+if __name__ == "__main__":
+    keys = list(sweep)
+    variants = [dict(zip(keys, values)) for values in itertools.product(*sweep.values())]
+    per_sheet = sheet_columns * sheet_rows
+    print(f"Rendering {len(variants)} variants at {thumb_width}x{thumb_height}")
+
+    # Start time of rendering
+    start_time = time.time()
+
+    results = []
+    with ProcessPoolExecutor() as pool:
+        for index, result in enumerate(pool.map(render_variant, variants, chunksize=4)):
+            results.append(result)
+            if (index + 1) % per_sheet == 0:
+                print(f"{index + 1}/{len(variants)} variants in {time.time() - start_time:.2f} seconds")
+
+    # Write one contact sheet image and one animated strip per page of variants
+    fourcc = cv2.VideoWriter_fourcc(*"mp4v")
+    for page, first in enumerate(range(0, len(variants), per_sheet)):
+        page_variants = variants[first:first + per_sheet]
+        page_results = results[first:first + per_sheet]
+
+        sheet_name = f"render/{epoch}_sheet_{page:02d}.png"
+        cv2.imwrite(sheet_name, tile([label(final.copy(), variant) for (final, _), variant in zip(page_results, page_variants)]))
+
+        strip_name = f"render/{epoch}_strip_{page:02d}.mp4"
+        out = cv2.VideoWriter(strip_name, fourcc, 30, (sheet_columns * thumb_width, sheet_rows * thumb_height))
+        for strip_index in range(strip_frames):
+            out.write(tile([label(strip[strip_index].copy(), variant) for (_, strip), variant in zip(page_results, page_variants)]))
+        out.release()
+        print(f"Contact sheet saved as {sheet_name}, animated strip as {strip_name}")
+
+    print(f"Sweep finished in {time.time() - start_time:.2f} seconds")
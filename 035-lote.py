@@ -0,0 +1,139 @@
+import cv2
+import numpy as np
+import os
+import time
+import random
+
+# Constants
+width, height = 1280, 720
+fps = 60
+duration_seconds = 60 * 1  # Duration of the video in seconds
+min_brush_size, max_brush_size = 15, 60  # Variable brush size range
+
+# Batch settings: number of variants advanced together, and frames whose
+# parameters are computed at once
+batch_size = 16
+chunk_frames = fps
+
+# Calculate the total number of frames
+total_frames = fps * duration_seconds
+
+# Create a render directory if it doesn't exist
+os.makedirs("render", exist_ok=True)
+
+# Generate the filenames using the current epoch time, one video per variant
+epoch = int(time.time())
+seeds = [random.randint(0, 2**31 - 1) for _ in range(batch_size)]
+filenames = [f"render/{epoch}_{seed}.mp4" for seed in seeds]
+
+# Create one VideoWriter object per variant
+fourcc = cv2.VideoWriter_fourcc(*"mp4v")
+outs = [cv2.VideoWriter(filename, fourcc, fps, (width, height)) for filename in filenames]
+
+# Center of the canvas
+cx, cy = width // 2, height // 2
+
+# Initialize the canvases of all variants in one buffer
+canvases = np.zeros((batch_size, height, width, 3), dtype=np.uint8)
+
+# Random parameters of every variant, drawn from its own seed as in 015
+num_segments = np.empty(batch_size, dtype=np.int64)
+random_a_offset = np.empty(batch_size)
+random_b_offset = np.empty(batch_size)
+random_rotation_offset = np.empty(batch_size)
+random_color_offset = np.empty(batch_size)
+for index, seed in enumerate(seeds):
+    generator = np.random.RandomState(seed)
+    num_segments[index] = generator.randint(3, 25)
+    random_a_offset[index] = generator.uniform(-10, 10)
+    random_b_offset[index] = generator.uniform(-10, 10)
+    random_rotation_offset[index] = generator.uniform(-0.05, 0.05)
+    random_color_offset[index] = generator.uniform(-0.05, 0.05)
+
+# Segment angles of every variant, padded to the largest segment count
+max_segments = num_segments.max()
+segment_index = np.arange(max_segments)
+segment_angles = segment_index[None, :] * (2 * np.pi / num_segments[:, None])  # (B, S)
+segment_counts = num_segments.tolist()
+
+# Function to compute the stamps of all variants for a range of frames at once
+def compute_chunk(first_frame, last_frame):
+    frame_number = np.arange(first_frame, last_frame)[None, :]  # (1, C)
+
+    # Smoothly vary elliptic parameters over time with added offsets, shape (B, C)
+    max_a = height * 0.4 + 60 * np.sin(frame_number * 0.01 + random_a_offset[:, None])
+    max_b = height * 0.1 + 35 * np.cos(frame_number * 0.01 + random_b_offset[:, None])
+    angle_variation = 0.02 + 0.001 * np.sin(frame_number * 0.005)
+
+    a = max_a * np.abs(np.sin(frame_number * 0.01))
+    b = max_b * np.abs(np.cos(frame_number * 0.01))
+    angle = frame_number * angle_variation
+
+    # Calculate the position on the ellipse (int() truncates toward zero, like astype)
+    x = (cx + a * np.cos(angle)).astype(np.int64)
+    y = (cy + b * np.sin(angle)).astype(np.int64)
+
+    # Rotate the ellipse around the center with smooth randomness
+    rotation_angle = frame_number * 0.01 + random_rotation_offset[:, None]
+    x_rot = (np.cos(rotation_angle) * (x - cx) - np.sin(rotation_angle) * (y - cy) + cx).astype(np.int64)
+    y_rot = (np.sin(rotation_angle) * (x - cx) + np.cos(rotation_angle) * (y - cy) + cy).astype(np.int64)
+
+    # Mirrored positions of every segment, shape (B, S, C)
+    cos_s = np.cos(segment_angles)[:, :, None]
+    sin_s = np.sin(segment_angles)[:, :, None]
+    dx, dy = (x_rot - cx)[:, None, :], (y_rot - cy)[:, None, :]
+    xs = (cos_s * dx - sin_s * dy + cx).astype(np.int64)
+    ys = (sin_s * dx + cos_s * dy + cy).astype(np.int64)
+
+    # Colors of every variant, shape (B, C, 3)
+    phase = frame_number * 0.02 + random_color_offset[:, None]
+    colors = ((np.sin(phase[:, :, None] + np.array([0, 2 * np.pi / 3, 4 * np.pi / 3])) + 1) * 127.5).astype(np.int64)
+
+    # Brush size depends only on the frame number
+    brush_size = (min_brush_size + (max_brush_size - min_brush_size) * (0.5 + 0.5 * np.sin(frame_number[0] * 0.01))).astype(np.int64)
+
+    return xs.tolist(), ys.tolist(), colors.tolist(), brush_size.tolist()
+
+# Start time of rendering
+start_time = time.time()
+
+for first_frame in range(0, total_frames, chunk_frames):
+    last_frame = min(first_frame + chunk_frames, total_frames)
+    xs, ys, colors, brush_sizes = compute_chunk(first_frame, last_frame)
+
+    for offset in range(last_frame - first_frame):
+        frame_number = first_frame + offset
+        brush_size = brush_sizes[offset]
+
+        # Draw the brush and its mirrored segments on every variant's canvas.
+        # Only the parameter math is batched: stamping and encoding still cost one
+        # call per circle and per variant. A shared mask grown with cv2.dilate, as in
+        # 052, is far slower here because the brush reaches a 121 pixel disc.
+        for variant in range(batch_size):
+            canvas = canvases[variant]
+            color = colors[variant][offset]
+            for segment in range(segment_counts[variant]):
+                cv2.circle(canvas, (xs[variant][segment][offset], ys[variant][segment][offset]), brush_size, color, -1)
+
+            # Write the frame to the variant's video file
+            outs[variant].write(canvas)
+
+        # Calculate statistics every second (every 'fps' frames)
+        if frame_number % fps == 0:
+            elapsed_time = time.time() - start_time
+            frames_remaining = total_frames - frame_number
+            time_remaining = (frames_remaining / fps) / 60  # In minutes
+            estimated_finish = time.time() + frames_remaining / fps
+            percentage_complete = (frame_number / total_frames) * 100
+
+            print(f"Time Elapsed: {elapsed_time:.2f} seconds")
+            print(f"Time Remaining: {time_remaining:.2f} minutes")
+            print(f"Estimated Time of Finish: {time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(estimated_finish))}")
+            print(f"Completion: {percentage_complete:.2f}%\n")
+
+# Release the VideoWriter objects
+for out in outs:
+    out.release()
+
+for filename in filenames:
+    print(f"Video saved as {filename}")
@@ -0,0 +1,211 @@
+import cv2
+import numpy as np
+import os
+import time
+import random
+from concurrent.futures import ThreadPoolExecutor
+
+# Constants
+width, height = 3840, 2160
+fps = 60
+duration_seconds = 60 * 1  # Duration of the video in seconds
+min_brush_size, max_brush_size = 15, 60  # Variable brush size range
+
+# Tile settings: the frame is split into a grid, and each tile paints the
+# squares that overlap it on a pool thread (OpenCV and NumPy release the GIL)
+tile_columns, tile_rows = 8, 4
+num_threads = os.cpu_count()
+
+# Calculate the total number of frames
+total_frames = fps * duration_seconds
+
+# Create a render directory if it doesn't exist
+os.makedirs("render", exist_ok=True)
+
+# Generate the filename using the current epoch time
+filename = f"render/{int(time.time())}.mp4"
+
+# Create a VideoWriter object
+fourcc = cv2.VideoWriter_fourcc(*"mp4v")
+out = cv2.VideoWriter(filename, fourcc, fps, (width, height))
+
+# Center of the canvas
+cx, cy = width // 2, height // 2
+
+# Initialize the canvas
+canvas = np.zeros((height, width, 3), dtype=np.uint8)
+
+# Number of kaleidoscope segments
+num_segments = random.randint(3, 24)
+
+# Initialize smooth random parameters with smaller, controlled offsets
+random_a_offset = np.random.uniform(-5, 5)
+random_b_offset = np.random.uniform(-5, 5)
+random_rotation_offset = np.random.uniform(-0.02, 0.02)
+random_color_offset = np.random.uniform(-0.02, 0.02)
+
+# Tile bounds (x0, y0, x1, y1) and the canvas view each tile draws into
+tile_xs = np.linspace(0, width, tile_columns + 1).astype(int)
+tile_ys = np.linspace(0, height, tile_rows + 1).astype(int)
+tiles = [(tile_xs[column], tile_ys[row], tile_xs[column + 1], tile_ys[row + 1]) for row in range(tile_rows) for column in range(tile_columns)]
+tile_views = [canvas[y0:y1, x0:x1] for x0, y0, x1, y1 in tiles]
+
+# Function to calculate smooth color transition with controlled randomness
+def calculate_color(frame_number, random_offset):
+    r = int(np.clip((np.sin(frame_number * 0.02 + random_offset) + 1) * 127.5, 0, 255))
+    g = int(np.clip((np.sin(frame_number * 0.02 + 2 * np.pi / 3 + random_offset) + 1) * 127.5, 0, 255))
+    b = int(np.clip((np.sin(frame_number * 0.02 + 4 * np.pi / 3 + random_offset) + 1) * 127.5, 0, 255))
+    return (r, g, b)
+
+# Function to collect the mirrored squares of a brush instead of drawing them
+def add_mirrored_segments(x, y, stamps, color, brush_size, rotation_angle):
+    for i in range(num_segments):
+        angle = i * (2 * np.pi / num_segments)
+        x_rot = int(np.cos(angle) * (x - cx) - np.sin(angle) * (y - cy) + cx)
+        y_rot = int(np.sin(angle) * (x - cx) + np.cos(angle) * (y - cy) + cy)
+
+        # Create the square's rotation matrix
+        rotation_matrix = cv2.getRotationMatrix2D((x_rot, y_rot), rotation_angle, 1)
+        half_size = brush_size // 2
+        square_pts = np.array([
+            [x_rot - half_size, y_rot - half_size],
+            [x_rot + half_size, y_rot - half_size],
+            [x_rot + half_size, y_rot + half_size],
+            [x_rot - half_size, y_rot + half_size]
+        ])
+        rotated_square = cv2.transform(np.array([square_pts]), rotation_matrix)[0]
+
+        stamps.append((np.int32(rotated_square), color))
+
+# Function to find the tiles covered by a box (x0, y0, x1, y1) clipped to the canvas
+def tile_span(x0, y0, x1, y1):
+    first_column, last_column = np.searchsorted(tile_xs, [x0, x1 - 1], side="right") - 1
+    first_row, last_row = np.searchsorted(tile_ys, [y0, y1 - 1], side="right") - 1
+    return first_column, last_column, first_row, last_row
+
+# Function to prepare one square for the tiles. OpenCV traces
+# polygon edges with clipped lines, so a square cut by a tile border would not get
+# the same pixels as on the full canvas. Those squares are rasterized once into a
+# mask of their bounding box, clipped only where the canvas itself clips.
+def prepare_stamp(stamp):
+    polygon, color = stamp
+    x0, y0 = np.maximum(polygon.min(axis=0), 0)
+    x1, y1 = np.minimum(polygon.max(axis=0) + 1, (width, height))
+    if x1 <= x0 or y1 <= y0:
+        return None  # Entirely off the canvas
+    box = (int(x0), int(y0), int(x1), int(y1))
+    first_column, last_column, first_row, last_row = tile_span(*box)
+    if first_column == last_column and first_row == last_row:
+        return box, polygon, None, color
+    mask = np.zeros((y1 - y0, x1 - x0), dtype=np.uint8)
+    cv2.fillPoly(mask, [polygon], 255, offset=(-box[0], -box[1]))
+    return box, polygon, mask, color
+
+# Function run on a pool thread: prepare a contiguous run of stamps. The pool gets
+# one run per thread, as preparing a single square is mostly Python under the GIL
+# and a future per square would cost more than it saves.
+def prepare_stamps(run):
+    return [prepare_stamp(stamp) for stamp in run]
+
+# Function to sort the prepared stamps into the tiles their boxes touch
+def bin_stamps(prepared):
+    tile_stamps = [[] for _ in tiles]
+    for stamp in prepared:
+        if stamp is None:
+            continue
+        first_column, last_column, first_row, last_row = tile_span(*stamp[0])
+        # Stamps arrive in drawing order, so each tile keeps that order
+        for row in range(first_row, last_row + 1):
+            for column in range(first_column, last_column + 1):
+                tile_stamps[row * tile_columns + column].append(stamp)
+    return tile_stamps
+
+# Function run on a pool thread: clear one tile and paint its stamps in order
+def draw_tile(tile_index, stamps):
+    view = tile_views[tile_index]
+    tx0, ty0, tx1, ty1 = tiles[tile_index]
+    view[:] = 0
+    for (x0, y0, x1, y1), polygon, mask, color in stamps:
+        if mask is None:
+            # The square lies inside this tile, draw it directly
+            cv2.fillPoly(view, [polygon], color, offset=(-int(tx0), -int(ty0)))
+            continue
+        # Paint the color through the part of the mask that overlaps the tile
+        ox0, oy0, ox1, oy1 = max(x0, tx0), max(y0, ty0), min(x1, tx1), min(y1, ty1)
+        solid = np.empty((oy1 - oy0, ox1 - ox0, 3), dtype=np.uint8)
+        cv2.rectangle(solid, (0, 0), (ox1 - ox0, oy1 - oy0), color, -1)
+        cv2.copyTo(solid, mask[oy0 - y0:oy1 - y0, ox0 - x0:ox1 - x0], view[oy0 - ty0:oy1 - ty0, ox0 - tx0:ox1 - tx0])
+
+# Dampening function to slow down the motion over time
+def dampening_factor(frame_number):
+    return 1 - np.clip(frame_number / total_frames, 0, 0.9)
+
+# Number of brushes
+num_brushes = 25  # Adjust as needed for complexity
+
+# Pool of drawing threads
+pool = ThreadPoolExecutor(max_workers=num_threads)
+
+# Start time of rendering
+start_time = time.time()
+
+for frame_number in range(total_frames):
+    # Squares of this frame, in the order the serial loop would draw them
+    stamps = []
+
+    # Apply dampening factor to slow down parameters over time
+    damp_factor = dampening_factor(frame_number)
+
+    for brush_index in range(num_brushes):
+        # Smoothly vary elliptic parameters over time with added offsets
+        max_a = width * 0.6 * np.abs(np.sin(frame_number * 0.01 * damp_factor + random_a_offset + brush_index))
+        max_b = height * 0.1 + 25 * np.cos(frame_number * 0.01 * damp_factor + random_b_offset + brush_index)
+        angle_variation = 0.015 * damp_factor + 0.001 * np.sin(frame_number * 0.005 * damp_factor)
+
+        a = max_a
+        b = max_b * np.abs(np.cos(frame_number * 0.01 * damp_factor + brush_index))
+        angle = frame_number * angle_variation + brush_index
+
+        # Calculate the position on the ellipse
+        x = int(cx + a * np.cos(angle))
+        y = int(cy + b * np.sin(angle))
+
+        # Rotate the ellipse around the center with smooth randomness
+        rotation_angle = frame_number * 0.01 * damp_factor + random_rotation_offset + brush_index
+
+        # Calculate the color for this frame with smooth randomness
+        color = calculate_color(frame_number + brush_index * 100, random_color_offset)
+
+        # Smoothly randomize brush size within a controlled range
+        brush_size = int(min_brush_size + (max_brush_size - min_brush_size) * (0.5 + 0.5 * np.sin(frame_number * 0.01 + brush_index)))
+        brush_size *= 5
+
+        # Collect the brush and its mirrored segments
+        add_mirrored_segments(x, y, stamps, color, brush_size, rotation_angle)
+
+    # Prepare the squares in parallel, then clear and paint every tile in parallel
+    runs = [stamps[i * len(stamps) // num_threads:(i + 1) * len(stamps) // num_threads] for i in range(num_threads)]
+    prepared = [stamp for run in pool.map(prepare_stamps, runs) for stamp in run]
+    list(pool.map(draw_tile, range(len(tiles)), bin_stamps(prepared)))
+
+    # Write the frame to the video file
+    out.write(canvas)
+
+    # Calculate statistics every second (every 'fps' frames)
+    if frame_number % fps == 0:
+        elapsed_time = time.time() - start_time
+        frames_remaining = total_frames - frame_number
+        time_remaining = (frames_remaining / fps) / 60  # In minutes
+        estimated_finish = time.time() + frames_remaining / fps
+        percentage_complete = (frame_number / total_frames) * 100
+
+        print(f"Time Elapsed: {elapsed_time:.2f} seconds")
+        print(f"Time Remaining: {time_remaining:.2f} minutes")
+        print(f"Estimated Time of Finish: {time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(estimated_finish))}")
+        print(f"Completion: {percentage_complete:.2f}%\n")
+
+# Release the VideoWriter object and the drawing threads
+out.release()
+pool.shutdown()
+
+print(f"Video saved as {filename}")
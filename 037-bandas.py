@@ -0,0 +1,177 @@
+import cv2
+import numpy as np
+import os
+import time
+import random
+from multiprocessing import Barrier, Process, shared_memory
+
+# Constants
+width, height = 3840, 2160
+fps = 60
+duration_seconds = 60 * 60  # Duration of the video in seconds
+min_brush_size, max_brush_size = 15, 60  # Variable brush size range
+
+# Band settings: each worker process owns a horizontal band of the persistent canvas
+num_workers = os.cpu_count()
+max_stamps = 24  # Largest number of circles in one frame (num_segments)
+
+# Calculate the total number of frames
+total_frames = fps * duration_seconds
+
+# Center of the canvas
+cx, cy = width // 2, height // 2
+
+# Number of kaleidoscope segments
+num_segments = random.randint(3, 24)
+
+# Initialize smooth random parameters with smaller, controlled offsets
+random_a_offset = np.random.uniform(-5, 5)
+random_b_offset = np.random.uniform(-5, 5)
+random_rotation_offset = np.random.uniform(-0.02, 0.02)
+random_color_offset = np.random.uniform(-0.02, 0.02)
+
+# Row bounds of every band
+band_rows = np.linspace(0, height, num_workers + 1).astype(int)
+
+# Function to calculate smooth color transition with controlled randomness
+def calculate_color(frame_number, random_offset):
+    r = int(np.clip((np.sin(frame_number * 0.02 + random_offset) + 1) * 127.5, 0, 255))
+    g = int(np.clip((np.sin(frame_number * 0.02 + 2 * np.pi / 3 + random_offset) + 1) * 127.5, 0, 255))
+    b = int(np.clip((np.sin(frame_number * 0.02 + 4 * np.pi / 3 + random_offset) + 1) * 127.5, 0, 255))
+    return (r, g, b)
+
+# Function to write the mirrored circles of a frame into a stamp table
+# (rows of x, y, radius, color channels) instead of drawing them
+def collect_mirrored_segments(x, y, stamps, color, brush_size):
+    for i in range(num_segments):
+        angle = i * (2 * np.pi / num_segments)
+        x_rot = int(np.cos(angle) * (x - cx) - np.sin(angle) * (y - cy) + cx)
+        y_rot = int(np.sin(angle) * (x - cx) + np.cos(angle) * (y - cy) + cy)
+        stamps[i] = (x_rot, y_rot, brush_size, *color)
+    return num_segments
+
+# Dampening function to slow down the motion over time
+def dampening_factor(frame_number):
+    return 1 - np.clip(frame_number / total_frames, 0, 0.9)
+
+# Function to attach to the shared canvas and the two stamp tables
+def open_shared(canvas_name, stamps_name):
+    canvas_memory = shared_memory.SharedMemory(name=canvas_name)
+    stamps_memory = shared_memory.SharedMemory(name=stamps_name)
+    canvas = np.ndarray((height, width, 3), dtype=np.uint8, buffer=canvas_memory.buf)
+    stamps = np.ndarray((2, max_stamps + 1, 6), dtype=np.int64, buffer=stamps_memory.buf)
+    return canvas_memory, stamps_memory, canvas, stamps
+
+# Function run in each worker process: apply the stamps that touch its band, every frame
+def band_worker(band_index, canvas_name, stamps_name, start, done):
+    canvas_memory, stamps_memory, canvas, stamps = open_shared(canvas_name, stamps_name)
+    y0, y1 = band_rows[band_index], band_rows[band_index + 1]
+    band = canvas[y0:y1]  # Filled circles rasterize per row, so the band gets the same pixels
+    for frame_number in range(total_frames):
+        start.wait()
+        table = stamps[frame_number % 2]
+        count = table[max_stamps, 0]
+        for x, y, radius, b, g, r in table[:count].tolist():
+            if y + radius >= y0 and y - radius < y1:
+                cv2.circle(band, (x, y - y0), radius, (b, g, r), -1)
+        done.wait()
+    del band, canvas, stamps, table
+    canvas_memory.close()
+    stamps_memory.close()
+
+# Function to compute the circles of one frame into a stamp table
+def compute_stamps(frame_number, table):
+    # Apply dampening factor to slow down parameters over time
+    damp_factor = dampening_factor(frame_number)
+
+    # Linearly interpolate max_a from 0.2 to 0.6 of the screen width over the duration of the video
+    max_a = width * (0.2 + (0.6 - 0.2) * (frame_number / total_frames))  # Adjusted semi-major axis
+    max_b = height * 0.1 + 25 * np.cos(frame_number * 0.01 * damp_factor + random_b_offset)  # Adjusted semi-minor axis
+    angle_variation = 0.015 * damp_factor + 0.001 * np.sin(frame_number * 0.005 * damp_factor)  # Smooth angle variation
+
+    a = max_a  # Keep the semi-major axis as is for maximum radius
+    b = max_b * np.abs(np.cos(frame_number * 0.01 * damp_factor))
+    angle = frame_number * angle_variation  # Angle with slight variation
+
+    # Calculate the position on the ellipse
+    x = int(cx + a * np.cos(angle))
+    y = int(cy + b * np.sin(angle))
+
+    # Rotate the ellipse around the center with smooth randomness
+    rotation_angle = frame_number * 0.01 * damp_factor + random_rotation_offset
+    x_rot = int(np.cos(rotation_angle) * (x - cx) - np.sin(rotation_angle) * (y - cy) + cx)
+    y_rot = int(np.sin(rotation_angle) * (x - cx) + np.cos(rotation_angle) * (y - cy) + cy)
+
+    # Calculate the color for this frame with smooth randomness
+    color = calculate_color(frame_number, random_color_offset)
+
+    # Smoothly randomize brush size within a controlled range
+    brush_size = int(min_brush_size + (max_brush_size - min_brush_size) * (0.5 + 0.5 * np.sin(frame_number * 0.01)))
+
+    # Record the brush and its mirrored segments; the count goes in the last row
+    table[max_stamps, 0] = collect_mirrored_segments(x_rot, y_rot, table, color, brush_size)
+
+if __name__ == "__main__":
+    # Create a render directory if it doesn't exist
+    os.makedirs("render", exist_ok=True)
+
+    # Generate the filename using the current epoch time
+    filename = f"render/{int(time.time())}.mp4"
+
+    # Create a VideoWriter object
+    fourcc = cv2.VideoWriter_fourcc(*"mp4v")
+    out = cv2.VideoWriter(filename, fourcc, fps, (width, height))
+
+    # Shared persistent canvas and a double-buffered stamp table: the workers
+    # draw frame N while the next frame's stamps are computed
+    canvas_memory = shared_memory.SharedMemory(create=True, size=height * width * 3)
+    stamps_memory = shared_memory.SharedMemory(create=True, size=2 * (max_stamps + 1) * 6 * 8)
+    canvas = np.ndarray((height, width, 3), dtype=np.uint8, buffer=canvas_memory.buf)
+    stamps = np.ndarray((2, max_stamps + 1, 6), dtype=np.int64, buffer=stamps_memory.buf)
+    canvas[:] = 0
+
+    start = Barrier(num_workers + 1)
+    done = Barrier(num_workers + 1)
+    workers = [Process(target=band_worker, args=(i, canvas_memory.name, stamps_memory.name, start, done)) for i in range(num_workers)]
+    for worker in workers:
+        worker.start()
+
+    # Start time of rendering
+    start_time = time.time()
+
+    compute_stamps(0, stamps[0])
+    for frame_number in range(total_frames):
+        # Let the bands draw this frame while the next frame's stamps are prepared
+        start.wait()
+        if frame_number + 1 < total_frames:
+            compute_stamps(frame_number + 1, stamps[(frame_number + 1) % 2])
+        done.wait()
+
+        # The bands tile the shared canvas, so it already holds the whole frame
+        out.write(canvas)
+
+        # Calculate statistics every second (every 'fps' frames)
+        if frame_number % fps == 0:
+            elapsed_time = time.time() - start_time
+            frames_remaining = total_frames - frame_number
+            time_remaining = (frames_remaining / fps) / 60  # In minutes
+            estimated_finish = time.time() + frames_remaining / fps
+            percentage_complete = (frame_number / total_frames) * 100
+
+            print(f"Time Elapsed: {elapsed_time:.2f} seconds")
+            print(f"Time Remaining: {time_remaining:.2f} minutes")
+            print(f"Estimated Time of Finish: {time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(estimated_finish))}")
+            print(f"Completion: {percentage_complete:.2f}%\n")
+
+    for worker in workers:
+        worker.join()
+
+    # Release the VideoWriter object and the shared memory
+    out.release()
+    del canvas, stamps
+    canvas_memory.close()
+    canvas_memory.unlink()
+    stamps_memory.close()
+    stamps_memory.unlink()
+
+    print(f"Video saved as {filename}")
@@ -0,0 +1,182 @@
+import cv2
+import numpy as np
+import os
+import time
+import struct
+
+# Constants
+width, height = 4096, 4096  # Size the walk is simulated at
+print_scale = 4  # The print is rendered at width * print_scale by height * print_scale
+fps = 60
+duration_seconds = 60 * 60  # Duration of the piece whose final canvas is printed
+brush_size = 30
+
+# Tile settings: only one tile is held in memory while rasterizing
+tile_size = 2048  # Must be a multiple of 16 for TIFF tiles
+
+# Calculate the total number of frames
+total_frames = fps * duration_seconds
+
+# Size of the print
+print_width, print_height = width * print_scale, height * print_scale
+
+# Create a render directory if it doesn't exist
+os.makedirs("render", exist_ok=True)
+
+# Generate the filename using the current epoch time
+filename = f"render/{int(time.time())}.tif"
+
+# Initial brush position, direction, and speed
+x, y = width // 2, height // 2
+speed = 5
+direction = np.random.uniform(0, 2 * np.pi)  # Random direction in radians
+
+# Function to update direction smoothly with a bias towards the center
+def update_direction(x, y, direction, rate=0.1, center_bias=0.02):
+    direction_change = np.random.uniform(-rate, rate)
+    direction += direction_change
+
+    # Calculate the bias towards the center
+    cx, cy = width // 2, height // 2
+    dx = cx - x
+    dy = cy - y
+    distance = np.sqrt(dx**2 + dy**2)
+
+    # Apply a bias based on the distance from the center
+    bias_direction = np.arctan2(dy, dx)
+    direction = (1 - center_bias) * direction + center_bias * bias_direction
+
+    return direction
+
+# Number of kaleidoscope segments
+num_segments = 8
+
+# Function to calculate smooth color transition
+def calculate_color(frame_number):
+    # Use sine functions to smoothly transition through RGB colors
+    r = int((np.sin(frame_number * 0.02) + 1) * 127.5)
+    g = int((np.sin(frame_number * 0.02 + 2 * np.pi / 3) + 1) * 127.5)
+    b = int((np.sin(frame_number * 0.02 + 4 * np.pi / 3) + 1) * 127.5)
+    return (r, g, b)
+
+# Stamps of the whole walk in drawing order, preallocated so memory stays at
+# 20 bytes per stamp however long the piece runs
+total_stamps = total_frames * num_segments
+stamp_x = np.empty(total_stamps, dtype=np.int32)
+stamp_y = np.empty(total_stamps, dtype=np.int32)
+stamp_colors = np.empty((total_stamps, 3), dtype=np.int32)
+
+# Function to record the mirrored segments of a frame as stamps instead of drawing them
+def add_mirrored_segments(x, y, frame_number, color):
+    cx, cy = width // 2, height // 2  # Center of the canvas
+    for i in range(num_segments):
+        angle = i * (2 * np.pi / num_segments)
+        # Calculate the rotated positions
+        x_rot = int(np.cos(angle) * (x - cx) - np.sin(angle) * (y - cy) + cx)
+        y_rot = int(np.sin(angle) * (x - cx) + np.cos(angle) * (y - cy) + cy)
+        index = frame_number * num_segments + i
+        stamp_x[index], stamp_y[index] = x_rot, y_rot
+        stamp_colors[index] = color
+
+# Function to write the TIFF header and tile directory, leaving room for the tile data
+def create_tiled_tiff(path, image_width, image_height, tile):
+    tiles_across = (image_width + tile - 1) // tile
+    tiles_down = (image_height + tile - 1) // tile
+    tile_count = tiles_across * tiles_down
+    tile_bytes = tile * tile * 3
+    data_offset = 8
+    entries = 12
+    ifd_offset = data_offset + tile_count * tile_bytes
+    arrays_offset = ifd_offset + 2 + entries * 12 + 4
+    offsets_offset = arrays_offset + 6  # After BitsPerSample (3 shorts)
+    counts_offset = offsets_offset + 4 * tile_count
+
+    def entry(tag, kind, count, value):
+        # kind 3 = SHORT, 4 = LONG; short single values are left-aligned
+        if kind == 3 and count == 1:
+            return struct.pack("<HHIHH", tag, kind, count, value, 0)
+        return struct.pack("<HHII", tag, kind, count, value)
+
+    with open(path, "wb") as file:
+        file.write(struct.pack("<2sHI", b"II", 42, ifd_offset))
+        file.truncate(ifd_offset)
+        file.seek(ifd_offset)
+        file.write(struct.pack("<H", entries))
+        file.write(entry(256, 4, 1, image_width))  # ImageWidth
+        file.write(entry(257, 4, 1, image_height))  # ImageLength
+        file.write(entry(258, 3, 3, arrays_offset))  # BitsPerSample
+        file.write(entry(259, 3, 1, 1))  # Compression: none
+        file.write(entry(262, 3, 1, 2))  # Photometric: RGB
+        file.write(entry(277, 3, 1, 3))  # SamplesPerPixel
+        file.write(entry(284, 3, 1, 1))  # PlanarConfiguration: contiguous
+        file.write(entry(322, 4, 1, tile))  # TileWidth
+        file.write(entry(323, 4, 1, tile))  # TileLength
+        file.write(entry(324, 4, tile_count, offsets_offset))  # TileOffsets
+        file.write(entry(325, 4, tile_count, counts_offset))  # TileByteCounts
+        file.write(entry(339, 3, 1, 1))  # SampleFormat: unsigned integer
+        file.write(struct.pack("<I", 0))  # No further directories
+        file.write(struct.pack("<3H", 8, 8, 8))
+        file.write(struct.pack(f"<{tile_count}I", *[data_offset + index * tile_bytes for index in range(tile_count)]))
+        file.write(struct.pack(f"<{tile_count}I", *([tile_bytes] * tile_count)))
+
+    return tiles_down, tiles_across
+
+# Function to map one tile of the file; unmapping it after each tile keeps the
+# resident memory bounded by the tile size
+def map_tile(path, index, tile):
+    return np.memmap(path, dtype=np.uint8, mode="r+", offset=8 + index * tile * tile * 3, shape=(tile, tile, 3))
+
+# Start time of rendering
+start_time = time.time()
+
+# Simulate the whole walk first, recording every stamp in drawing order
+for frame_number in range(total_frames):
+    # Update the direction smoothly with a bias towards the center
+    direction = update_direction(x, y, direction)
+
+    # Calculate the new position
+    x += int(speed * np.cos(direction))
+    y += int(speed * np.sin(direction))
+
+    # Bounce off the borders
+    if x <= brush_size or x >= width - brush_size:
+        direction = np.pi - direction
+    if y <= brush_size or y >= height - brush_size:
+        direction = -direction
+
+    # Ensure the brush stays within bounds
+    x = np.clip(x, brush_size, width - brush_size)
+    y = np.clip(y, brush_size, height - brush_size)
+
+    # Calculate the color for this frame and record the mirrored stamps
+    add_mirrored_segments(x, y, frame_number, calculate_color(frame_number))
+
+# Scale the stamps to the print in place
+stamp_x *= print_scale
+stamp_y *= print_scale
+radius = brush_size * print_scale
+print(f"Simulated {total_frames} frames ({len(stamp_x)} stamps) in {time.time() - start_time:.2f} seconds")
+
+# Rasterize the print tile by tile, straight into the memory-mapped file
+tiles_down, tiles_across = create_tiled_tiff(filename, print_width, print_height, tile_size)
+tile_canvas = np.zeros((tile_size, tile_size, 3), dtype=np.uint8)
+for row in range(tiles_down):
+    for column in range(tiles_across):
+        x0, y0 = column * tile_size, row * tile_size
+
+        # Only the stamps whose bounding boxes reach this tile, in drawing order
+        inside = (stamp_x + radius >= x0) & (stamp_x - radius < x0 + tile_size) & (stamp_y + radius >= y0) & (stamp_y - radius < y0 + tile_size)
+        tile_canvas[:] = 0
+        tile_x, tile_y = (stamp_x[inside] - x0).tolist(), (stamp_y[inside] - y0).tolist()
+        for center_x, center_y, color in zip(tile_x, tile_y, stamp_colors[inside].tolist()):
+            cv2.circle(tile_canvas, (center_x, center_y), radius, color, -1)
+
+        # TIFF stores RGB, the canvas is BGR like the videos
+        tile = map_tile(filename, row * tiles_across + column, tile_size)
+        tile[:] = tile_canvas[:, :, ::-1]
+        tile.flush()
+        del tile
+        print(f"Tile {row * tiles_across + column + 1}/{tiles_down * tiles_across}: {int(inside.sum())} stamps")
+
+print(f"Rendered in {time.time() - start_time:.2f} seconds")
+print(f"Print saved as {filename}")
@@ -0,0 +1,193 @@
+import cv2
+import numpy as np
+import os
+import time
+import random
+
+# Constants
+width, height = 1280, 720
+fps = 60
+duration_seconds = 60 * 1  # Duration of the video in seconds
+min_brush_size, max_brush_size = 15, 60  # Variable brush size range
+
+# Calculate the total number of frames
+total_frames = fps * duration_seconds
+
+# Create a render directory if it doesn't exist
+os.makedirs("render", exist_ok=True)
+
+# Generate the filename using the current epoch time
+filename = f"render/{int(time.time())}.mp4"
+
+# Create a VideoWriter object
+fourcc = cv2.VideoWriter_fourcc(*"mp4v")
+out = cv2.VideoWriter(filename, fourcc, fps, (width, height))
+
+# Center of the canvas
+cx, cy = width // 2, height // 2
+
+# Number of kaleidoscope segments
+num_segments = random.randint(3, 24)
+
+# Initialize smooth random parameters with smaller, controlled offsets
+random_a_offset = np.random.uniform(-5, 5)
+random_b_offset = np.random.uniform(-5, 5)
+random_rotation_offset = np.random.uniform(-0.02, 0.02)
+random_color_offset = np.random.uniform(-0.02, 0.02)
+
+# Number of brushes
+num_brushes = 25  # Adjust as needed for complexity
+brush_index = np.arange(num_brushes)
+
+# Segment rotations and the corners of a unit square around its center
+segment_angles = np.arange(num_segments) * (2 * np.pi / num_segments)
+square_corners = np.array([[-1, -1], [1, -1], [1, 1], [-1, 1]])
+
+# A square clipped by the four canvas edges has at most 8 corners
+max_clipped_corners = 8
+
+# Function to calculate smooth color transition for all brushes at once
+def calculate_colors(frame_numbers, random_offset):
+    phase = frame_numbers[:, None] * 0.02 + np.array([0, 2 * np.pi / 3, 4 * np.pi / 3]) + random_offset
+    return np.clip((np.sin(phase) + 1) * 127.5, 0, 255).astype(np.int64)
+
+# Function to compute the corners of every mirrored, rotated square of a frame,
+# shape (brushes * segments, 4, 2) in drawing order
+def mirrored_squares(x, y, brush_size, rotation_angle):
+    # Rotated positions of every segment, shape (brushes, segments)
+    cos_s, sin_s = np.cos(segment_angles), np.sin(segment_angles)
+    dx, dy = (x - cx)[:, None], (y - cy)[:, None]
+    x_rot = (cos_s * dx - sin_s * dy + cx).astype(np.int64)
+    y_rot = (sin_s * dx + cos_s * dy + cy).astype(np.int64)
+
+    # Rotate each square around its own center and round the corners, as
+    # cv2.getRotationMatrix2D and cv2.transform on integer points do
+    half_size = (brush_size // 2)[:, None, None]
+    alpha = np.cos(np.radians(rotation_angle))[:, None, None]
+    beta = np.sin(np.radians(rotation_angle))[:, None, None]
+    offset_x = square_corners[:, 0] * half_size  # (brushes, 1, 4)
+    offset_y = square_corners[:, 1] * half_size
+    corners_x = x_rot[:, :, None] + alpha * offset_x + beta * offset_y
+    corners_y = y_rot[:, :, None] - beta * offset_x + alpha * offset_y
+    return np.rint(np.stack([corners_x, corners_y], axis=-1).reshape(-1, 4, 2))
+
+# Function to clip polygons against one edge (points with axis value <= / >= limit
+# are kept); polygons have shape (N, V, 2) with the first counts[n] corners in use
+def clip_edge(polygons, counts, axis, limit, keep_below):
+    corner = np.arange(polygons.shape[1])[None, :]
+    in_use = corner < counts[:, None]
+    next_corner = np.where(corner + 1 < counts[:, None], corner + 1, 0)
+    start = polygons
+    end = np.take_along_axis(polygons, next_corner[:, :, None], axis=1)
+    start_inside = start[:, :, axis] <= limit if keep_below else start[:, :, axis] >= limit
+    end_inside = end[:, :, axis] <= limit if keep_below else end[:, :, axis] >= limit
+
+    # Point where each edge crosses the limit
+    delta = end[:, :, axis] - start[:, :, axis]
+    t = np.divide(limit - start[:, :, axis], delta, out=np.zeros_like(delta), where=delta != 0)
+    crossing = start + t[:, :, None] * (end - start)
+
+    # Each edge emits its crossing (if it crosses) and its end point (if inside)
+    candidates = np.stack([crossing, end], axis=2).reshape(len(polygons), -1, 2)
+    valid = np.stack([in_use & (start_inside != end_inside), in_use & end_inside], axis=2).reshape(len(polygons), -1)
+
+    # Compact the valid points to the front, keeping their order, and zero the rest
+    order = np.argsort(~valid, axis=1, kind="stable")
+    candidates = np.take_along_axis(candidates, order[:, :, None], axis=1)[:, :max_clipped_corners]
+    counts = valid.sum(axis=1)
+    candidates[np.arange(max_clipped_corners)[None, :] >= counts[:, None]] = 0
+    return candidates, counts
+
+# Function to drop the squares that are fully off the canvas and clip the rest to it;
+# returns the drawing-order index, corners and corner count of every visible square
+def cull_and_clip(polygons):
+    low, high = polygons.min(axis=1), polygons.max(axis=1)
+    visible = (high[:, 0] >= 0) & (low[:, 0] <= width - 1) & (high[:, 1] >= 0) & (low[:, 1] <= height - 1)
+    indices = np.flatnonzero(visible)
+
+    clipped = np.zeros((len(indices), max_clipped_corners, 2))
+    clipped[:, :4] = polygons[indices]
+    counts = np.full(len(indices), 4)
+
+    # Only squares that cross an edge need clipping
+    partial = (low[indices] < 0).any(axis=1) | (high[indices, 0] > width - 1) | (high[indices, 1] > height - 1)
+    if partial.any():
+        shapes, shape_counts = clipped[partial], counts[partial]
+        for axis, limit, keep_below in ((0, 0, False), (0, width - 1, True), (1, 0, False), (1, height - 1, True)):
+            shapes, shape_counts = clip_edge(shapes, shape_counts, axis, limit, keep_below)
+        clipped[partial], counts[partial] = shapes, shape_counts
+
+        # A box can reach the canvas while the square itself does not
+        keep = counts >= 3
+        indices, clipped, counts = indices[keep], clipped[keep], counts[keep]
+
+    return indices, np.rint(clipped).astype(np.int32), counts
+
+# Dampening function to slow down the motion over time
+def dampening_factor(frame_number):
+    return 1 - np.clip(frame_number / total_frames, 0, 0.9)
+
+# Start time of rendering
+start_time = time.time()
+total_culled = 0
+
+for frame_number in range(total_frames):
+    # Clear the canvas for each frame to remove trails
+    canvas = np.zeros((height, width, 3), dtype=np.uint8)
+
+    # Apply dampening factor to slow down parameters over time
+    damp_factor = dampening_factor(frame_number)
+
+    # Smoothly vary elliptic parameters of every brush with added offsets
+    max_a = width * 0.6 * np.abs(np.sin(frame_number * 0.01 * damp_factor + random_a_offset + brush_index))
+    max_b = height * 0.1 + 25 * np.cos(frame_number * 0.01 * damp_factor + random_b_offset + brush_index)
+    angle_variation = 0.015 * damp_factor + 0.001 * np.sin(frame_number * 0.005 * damp_factor)
+
+    a = max_a
+    b = max_b * np.abs(np.cos(frame_number * 0.01 * damp_factor + brush_index))
+    angle = frame_number * angle_variation + brush_index
+
+    # Calculate the positions on the ellipses
+    x = (cx + a * np.cos(angle)).astype(np.int64)
+    y = (cy + b * np.sin(angle)).astype(np.int64)
+
+    # Rotate the squares around their centers with smooth randomness
+    rotation_angle = frame_number * 0.01 * damp_factor + random_rotation_offset + brush_index
+
+    # Calculate the colors for this frame with smooth randomness
+    colors = calculate_colors(frame_number + brush_index * 100, random_color_offset).tolist()
+
+    # Smoothly randomize brush sizes within a controlled range
+    brush_size = (min_brush_size + (max_brush_size - min_brush_size) * (0.5 + 0.5 * np.sin(frame_number * 0.01 + brush_index))).astype(np.int64)
+    brush_size *= 5
+
+    # Cull and clip every square of the frame in one pass, then draw what is left in order
+    squares = mirrored_squares(x, y, brush_size, rotation_angle)
+    indices, clipped, counts = cull_and_clip(squares)
+    culled = len(squares) - len(indices)
+    total_culled += culled
+    for index, polygon, count in zip((indices // num_segments).tolist(), clipped, counts.tolist()):
+        cv2.fillPoly(canvas, [polygon[:count]], colors[index])
+
+    # Write the frame to the video file
+    out.write(canvas)
+
+    # Calculate statistics every second (every 'fps' frames)
+    if frame_number % fps == 0:
+        elapsed_time = time.time() - start_time
+        frames_remaining = total_frames - frame_number
+        time_remaining = (frames_remaining / fps) / 60  # In minutes
+        estimated_finish = time.time() + frames_remaining / fps
+        percentage_complete = (frame_number / total_frames) * 100
+
+        print(f"Time Elapsed: {elapsed_time:.2f} seconds")
+        print(f"Time Remaining: {time_remaining:.2f} minutes")
+        print(f"Estimated Time of Finish: {time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(estimated_finish))}")
+        print(f"Completion: {percentage_complete:.2f}%")
+        print(f"Culled Squares: {culled} of {len(squares)}\n")
+
+# Release the VideoWriter object
+out.release()
+
+print(f"Culled {total_culled} of {total_frames * num_brushes * num_segments} squares")
+print(f"Video saved as {filename}")
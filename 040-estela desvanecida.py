@@ -0,0 +1,175 @@
+import cv2
+import numpy as np
+import os
+import time
+
+# Constants
+width, height = 3840, 2160
+fps = 60
+duration_seconds = 60 * 60  # Duration of the video in seconds
+brush_size = 30
+
+# Trail fade settings
+half_life_seconds = 4  # Time for the trail to lose half of its brightness
+tile_size = 128  # Decay is tracked and applied per tile of this size
+
+# Calculate the total number of frames
+total_frames = fps * duration_seconds
+
+# Create a render directory if it doesn't exist
+os.makedirs("render", exist_ok=True)
+
+# Generate the filename using the current epoch time
+filename = f"render/{int(time.time())}.mp4"
+
+# Create a VideoWriter object
+fourcc = cv2.VideoWriter_fourcc(*"mp4v")
+out = cv2.VideoWriter(filename, fourcc, fps, (width, height))
+
+# Initial brush position, direction, and speed
+x, y = width // 2, height // 2
+speed = 5
+direction = np.random.uniform(0, 2 * np.pi)  # Random direction in radians
+
+# Function to update direction smoothly with a bias towards the center
+def update_direction(x, y, direction, rate=0.1, center_bias=0.02):
+    direction_change = np.random.uniform(-rate, rate)
+    direction += direction_change
+
+    # Calculate the bias towards the center
+    cx, cy = width // 2, height // 2
+    dx = cx - x
+    dy = cy - y
+    distance = np.sqrt(dx**2 + dy**2)
+
+    # Apply a bias based on the distance from the center
+    bias_direction = np.arctan2(dy, dx)
+    direction = (1 - center_bias) * direction + center_bias * bias_direction
+
+    return direction
+
+# The trail is kept in two canvases: "canvas" holds every tile as it was when
+# its decay was last brought up to date, and "frame" is what gets written.
+# "canvas" stores 8.8 fixed point (value * 256) in uint16 so repeated small
+# decay steps do not leave dim pixels stuck at the same 8-bit value
+fixed_point = 256
+canvas = np.zeros((height, width, 3), dtype=np.uint16)
+frame = np.zeros((height, width, 3), dtype=np.uint8)
+
+# Decay factors: decay_factors[k] is the brightness left after k frames, applied
+# as one scalar multiply. These replace per-age cv2.LUT tables: LUT only takes
+# 8-bit input, and folding decay into an 8-bit canvas on every touch rounds dim
+# pixels to a value they never leave. After dead_after frames every value has
+# faded to zero.
+decay_per_frame = 0.5 ** (1 / (half_life_seconds * fps))
+dead_after = int(np.ceil(np.log(0.5 / 255) / np.log(decay_per_frame)))
+decay_factors = decay_per_frame ** np.arange(dead_after + 1)
+
+# Tiles of both canvases and the frame each tile's decay was last folded in
+tile_rows = (height + tile_size - 1) // tile_size
+tile_columns = (width + tile_size - 1) // tile_size
+canvas_tiles = [[canvas[r * tile_size:(r + 1) * tile_size, c * tile_size:(c + 1) * tile_size] for c in range(tile_columns)] for r in range(tile_rows)]
+frame_tiles = [[frame[r * tile_size:(r + 1) * tile_size, c * tile_size:(c + 1) * tile_size] for c in range(tile_columns)] for r in range(tile_rows)]
+updated_at = np.full((tile_rows, tile_columns), -1, dtype=np.int64)  # -1: never painted
+live_tiles = set()  # Tiles that may still hold visible pixels
+
+# Function to fold the pending decay of the tiles under a stamp before painting on them,
+# so fresh paint always starts at full brightness
+def touch_tiles(x, y, radius, frame_number):
+    for row in range(max((y - radius) // tile_size, 0), min((y + radius) // tile_size, tile_rows - 1) + 1):
+        for column in range(max((x - radius) // tile_size, 0), min((x + radius) // tile_size, tile_columns - 1) + 1):
+            view = canvas_tiles[row][column]
+            age = frame_number - updated_at[row, column]
+            if (row, column) not in live_tiles:
+                # Never painted or fully faded: start again from black
+                view[:] = 0
+                live_tiles.add((row, column))
+            elif age > 0:
+                scale = decay_factors[min(age, dead_after)]
+                cv2.multiply(view, (scale, scale, scale), dst=view)
+            updated_at[row, column] = frame_number
+
+# Function to build the output frame, applying each live tile's pending decay
+def emit_frame(frame_number):
+    for row, column in list(live_tiles):
+        age = frame_number - updated_at[row, column]
+        if age >= dead_after:
+            # Fully faded: clear it once and stop tracking it
+            frame_tiles[row][column][:] = 0
+            live_tiles.discard((row, column))
+        else:
+            # Scale back to 8 bits; the -0.499 offset truncates instead of rounding
+            # so fixed point residue below one unit never shows
+            cv2.convertScaleAbs(canvas_tiles[row][column], dst=frame_tiles[row][column], alpha=decay_factors[age] / fixed_point, beta=-0.499)
+    return frame
+
+# Number of kaleidoscope segments
+num_segments = 8
+
+# Function to calculate smooth color transition
+def calculate_color(frame_number):
+    # Use sine functions to smoothly transition through RGB colors
+    r = int((np.sin(frame_number * 0.02) + 1) * 127.5)
+    g = int((np.sin(frame_number * 0.02 + 2 * np.pi / 3) + 1) * 127.5)
+    b = int((np.sin(frame_number * 0.02 + 4 * np.pi / 3) + 1) * 127.5)
+    return (r, g, b)
+
+# Function to draw mirrored segments
+def draw_mirrored_segments(x, y, canvas, color, frame_number):
+    cx, cy = width // 2, height // 2  # Center of the canvas
+    for i in range(num_segments):
+        angle = i * (2 * np.pi / num_segments)
+        # Calculate the rotated positions
+        x_rot = int(np.cos(angle) * (x - cx) - np.sin(angle) * (y - cy) + cx)
+        y_rot = int(np.sin(angle) * (x - cx) + np.cos(angle) * (y - cy) + cy)
+        touch_tiles(x_rot, y_rot, brush_size, frame_number)
+        cv2.circle(canvas, (x_rot, y_rot), brush_size, [channel * fixed_point for channel in color], -1)
+
+# Start time of rendering
+start_time = time.time()
+
+for frame_number in range(total_frames):
+    # Update the direction smoothly with a bias towards the center
+    direction = update_direction(x, y, direction)
+
+    # Calculate the new position
+    x += int(speed * np.cos(direction))
+    y += int(speed * np.sin(direction))
+
+    # Bounce off the borders
+    if x <= brush_size or x >= width - brush_size:
+        direction = np.pi - direction
+    if y <= brush_size or y >= height - brush_size:
+        direction = -direction
+
+    # Ensure the brush stays within bounds
+    x = np.clip(x, brush_size, width - brush_size)
+    y = np.clip(y, brush_size, height - brush_size)
+
+    # Calculate the color for this frame
+    color = calculate_color(frame_number)
+
+    # Draw the brush and its mirrored segments on the canvas
+    draw_mirrored_segments(x, y, canvas, color, frame_number)
+
+    # Write the faded frame to the video file
+    out.write(emit_frame(frame_number))
+
+    # Calculate statistics every second (every 'fps' frames)
+    if frame_number % fps == 0:
+        elapsed_time = time.time() - start_time
+        frames_remaining = total_frames - frame_number
+        time_remaining = (frames_remaining / fps) / 60  # In minutes
+        estimated_finish = time.time() + frames_remaining / fps
+        percentage_complete = (frame_number / total_frames) * 100
+
+        print(f"Time Elapsed: {elapsed_time:.2f} seconds")
+        print(f"Time Remaining: {time_remaining:.2f} minutes")
+        print(f"Estimated Time of Finish: {time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(estimated_finish))}")
+        print(f"Completion: {percentage_complete:.2f}%")
+        print(f"Live Tiles: {len(live_tiles)} of {tile_rows * tile_columns}\n")
+
+# Release the VideoWriter object
+out.release()
+
+print(f"Video saved as {filename}")
@@ -0,0 +1,213 @@
+import cv2
+import numpy as np
+import os
+import time
+import random
+
+# Constants
+width, height = 1280, 720
+fps = 60
+duration_seconds = 60 * 1  # Duration of the video in seconds
+min_brush_size, max_brush_size = 15, 60  # Variable brush size range
+
+# Calculate the total number of frames
+total_frames = fps * duration_seconds
+
+# Create a render directory if it doesn't exist
+os.makedirs("render", exist_ok=True)
+
+# Generate the filename using the current epoch time
+filename = f"render/{int(time.time())}.mp4"
+
+# Create a VideoWriter object
+fourcc = cv2.VideoWriter_fourcc(*"mp4v")
+out = cv2.VideoWriter(filename, fourcc, fps, (width, height))
+
+# Center of the canvas
+cx, cy = width // 2, height // 2
+
+# Number of kaleidoscope segments
+num_segments = random.randint(3, 24)
+
+# Initialize smooth random parameters with smaller, controlled offsets
+random_a_offset = np.random.uniform(-5, 5)
+random_b_offset = np.random.uniform(-5, 5)
+random_rotation_offset = np.random.uniform(-0.02, 0.02)
+random_color_offset = np.random.uniform(-0.02, 0.02)
+
+# Compositing works on a grid of tiles of this size
+tile_size = 32
+tile_rows = (height + tile_size - 1) // tile_size
+tile_columns = (width + tile_size - 1) // tile_size
+
+# A layer is an image on black (black is transparent) composited with a blend mode.
+# Persistent layers keep what is drawn on them; ephemeral layers only show what
+# was drawn during the current frame. Each layer records the boxes it changed,
+# and its image is allocated once and then only cleared where it was drawn on.
+class Layer:
+    def __init__(self, blend, persistent=True, alpha=1.0):
+        self.image = np.zeros((height, width, 3), dtype=np.uint8)
+        self.blend = blend  # "over", "add", "max", "alpha" or "screen"
+        self.persistent = persistent
+        self.alpha = alpha
+        self.dirty = []  # Boxes (x0, y0, x1, y1) drawn on since the last composite
+        self.stale = []  # Boxes an ephemeral layer cleared at the start of this frame
+
+    # Function to draw a circle on the layer and record the box it touched
+    def circle(self, center, radius, color, thickness=-1):
+        cv2.circle(self.image, center, radius, color, thickness)
+        reach = radius + max(thickness, 0)
+        x0, y0 = max(center[0] - reach, 0), max(center[1] - reach, 0)
+        x1, y1 = min(center[0] + reach + 1, width), min(center[1] + reach + 1, height)
+        if x0 < x1 and y0 < y1:
+            self.dirty.append((x0, y0, x1, y1))
+
+    # Function to start a new frame: ephemeral layers clear only what they drew last frame
+    def begin_frame(self):
+        if not self.persistent:
+            for x0, y0, x1, y1 in self.dirty:
+                self.image[y0:y1, x0:x1] = 0
+            self.stale, self.dirty = self.dirty, []
+
+# Function to find the pixels of a layer region that are not black
+def coverage(layer_region):
+    return cv2.bitwise_not(cv2.inRange(layer_region, (0, 0, 0), (0, 0, 0)))
+
+# Function to blend one region of a layer into the same region of the frame, in place
+def blend_region(frame_region, layer_region, layer, scratch_region):
+    if layer.blend == "over":
+        # Opaque wherever the layer is not black
+        cv2.copyTo(layer_region, coverage(layer_region), frame_region)
+    elif layer.blend == "add":
+        cv2.add(frame_region, layer_region, dst=frame_region)
+    elif layer.blend == "max":
+        cv2.max(frame_region, layer_region, dst=frame_region)
+    elif layer.blend == "alpha":
+        # Mix with the given opacity where the layer is not black
+        cv2.addWeighted(layer_region, layer.alpha, frame_region, 1 - layer.alpha, 0, dst=scratch_region)
+        cv2.copyTo(scratch_region, coverage(layer_region), frame_region)
+    elif layer.blend == "screen":
+        # 255 - (255 - frame) * (255 - layer) / 255
+        cv2.bitwise_not(frame_region, dst=frame_region)
+        cv2.bitwise_not(layer_region, dst=scratch_region)
+        cv2.multiply(frame_region, scratch_region, dst=frame_region, scale=1 / 255)
+        cv2.bitwise_not(frame_region, dst=frame_region)
+
+# Function to bring the frame up to date. The boxes the layers changed are marked
+# on a grid of tiles, and only runs of marked tiles are rebuilt, from the bottom
+# layer up, so overlapping boxes are composited once and an overlay costs about its own area.
+def composite(frame, layers, scratch):
+    marked = np.zeros((tile_rows, tile_columns), dtype=bool)
+    for layer in layers:
+        for x0, y0, x1, y1 in layer.dirty + layer.stale:
+            marked[y0 // tile_size:(y1 - 1) // tile_size + 1, x0 // tile_size:(x1 - 1) // tile_size + 1] = True
+
+    runs = 0
+    for row in np.flatnonzero(marked.any(axis=1)).tolist():
+        # Each run of marked tiles in a row is rebuilt as one region
+        edges = np.flatnonzero(np.diff(np.concatenate(([0], marked[row].view(np.int8), [0])))).tolist()
+        y0, y1 = row * tile_size, min((row + 1) * tile_size, height)
+        for first, last in zip(edges[::2], edges[1::2]):
+            x0, x1 = first * tile_size, min(last * tile_size, width)
+            frame_region = frame[y0:y1, x0:x1]
+            frame_region[:] = layers[0].image[y0:y1, x0:x1]  # The bottom layer goes over black
+            for layer in layers[1:]:
+                blend_region(frame_region, layer.image[y0:y1, x0:x1], layer, scratch[y0:y1, x0:x1])
+            runs += 1
+
+    for layer in layers:
+        if layer.persistent:
+            layer.dirty = []
+        layer.stale = []
+    return runs
+
+# Function to calculate smooth color transition with controlled randomness
+def calculate_color(frame_number, random_offset):
+    r = int(np.clip((np.sin(frame_number * 0.02 + random_offset) + 1) * 127.5, 0, 255))
+    g = int(np.clip((np.sin(frame_number * 0.02 + 2 * np.pi / 3 + random_offset) + 1) * 127.5, 0, 255))
+    b = int(np.clip((np.sin(frame_number * 0.02 + 4 * np.pi / 3 + random_offset) + 1) * 127.5, 0, 255))
+    return (r, g, b)
+
+# Function to draw mirrored segments with smooth randomness on a layer
+def draw_mirrored_segments(x, y, layer, color, brush_size, thickness=-1):
+    for i in range(num_segments):
+        angle = i * (2 * np.pi / num_segments)
+        x_rot = int(np.cos(angle) * (x - cx) - np.sin(angle) * (y - cy) + cx)
+        y_rot = int(np.sin(angle) * (x - cx) + np.cos(angle) * (y - cy) + cy)
+        layer.circle((x_rot, y_rot), brush_size, color, thickness)
+
+# Dampening function to slow down the motion over time
+def dampening_factor(frame_number):
+    return 1 - np.clip(frame_number / total_frames, 0, 0.9)
+
+# The persistent trail, a soft halo and a bright ring around the live brushes
+trail = Layer("over")
+halo = Layer("alpha", persistent=False, alpha=0.35)
+ring = Layer("screen", persistent=False)
+layers = [trail, halo, ring]
+
+# Composited output and a scratch buffer for the blends, reused every frame
+frame = np.zeros((height, width, 3), dtype=np.uint8)
+scratch = np.zeros((height, width, 3), dtype=np.uint8)
+
+# Start time of rendering
+start_time = time.time()
+
+for frame_number in range(total_frames):
+    for layer in layers:
+        layer.begin_frame()
+
+    # Apply dampening factor to slow down parameters over time
+    damp_factor = dampening_factor(frame_number)
+
+    # Smoothly vary elliptic parameters over time with added offsets
+    max_a = width * 0.2 * np.abs(np.sin(frame_number * 0.01 * damp_factor + random_a_offset))  # Adjusted semi-major axis
+    max_b = height * 0.1 + 25 * np.cos(frame_number * 0.01 * damp_factor + random_b_offset)  # Adjusted semi-minor axis
+    angle_variation = 0.015 * damp_factor + 0.001 * np.sin(frame_number * 0.005 * damp_factor)  # Smooth angle variation
+
+    a = max_a  # Keep the semi-major axis as is for maximum radius
+    b = max_b * np.abs(np.cos(frame_number * 0.01 * damp_factor))
+    angle = frame_number * angle_variation  # Angle with slight variation
+
+    # Calculate the position on the ellipse
+    x = int(cx + a * np.cos(angle))
+    y = int(cy + b * np.sin(angle))
+
+    # Rotate the ellipse around the center with smooth randomness
+    rotation_angle = frame_number * 0.01 * damp_factor + random_rotation_offset
+    x_rot = int(np.cos(rotation_angle) * (x - cx) - np.sin(rotation_angle) * (y - cy) + cx)
+    y_rot = int(np.sin(rotation_angle) * (x - cx) + np.cos(rotation_angle) * (y - cy) + cy)
+
+    # Calculate the color for this frame with smooth randomness
+    color = calculate_color(frame_number, random_color_offset)
+
+    # Smoothly randomize brush size within a controlled range
+    brush_size = int(min_brush_size + (max_brush_size - min_brush_size) * (0.5 + 0.5 * np.sin(frame_number * 0.01)))
+
+    # Draw the brush and its mirrored segments on the trail, and the live overlay on top
+    draw_mirrored_segments(x_rot, y_rot, trail, color, brush_size)
+    draw_mirrored_segments(x_rot, y_rot, halo, (255, 255, 255), brush_size + 12)
+    draw_mirrored_segments(x_rot, y_rot, ring, color[::-1], brush_size + 6, thickness=3)
+
+    # Rebuild the changed regions of the frame and write it to the video file
+    regions = composite(frame, layers, scratch)
+    out.write(frame)
+
+    # Calculate statistics every second (every 'fps' frames)
+    if frame_number % fps == 0:
+        elapsed_time = time.time() - start_time
+        frames_remaining = total_frames - frame_number
+        time_remaining = (frames_remaining / fps) / 60  # In minutes
+        estimated_finish = time.time() + frames_remaining / fps
+        percentage_complete = (frame_number / total_frames) * 100
+
+        print(f"Time Elapsed: {elapsed_time:.2f} seconds")
+        print(f"Time Remaining: {time_remaining:.2f} minutes")
+        print(f"Estimated Time of Finish: {time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(estimated_finish))}")
+        print(f"Completion: {percentage_complete:.2f}%")
+        print(f"Composited Regions: {regions}\n")
+
+# Release the VideoWriter object
+out.release()
+
+print(f"Video saved as {filename}")
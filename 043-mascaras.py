@@ -0,0 +1,179 @@
+import cv2
+import numpy as np
+import os
+import time
+import random
+from collections import OrderedDict
+
+# Constants
+width, height = 1280, 720
+fps = 60
+duration_seconds = 60 * 1  # Duration of the video in seconds
+min_brush_size, max_brush_size = 15, 60  # Variable brush size range
+
+# Calculate the total number of frames
+total_frames = fps * duration_seconds
+
+# Create a render directory if it doesn't exist
+os.makedirs("render", exist_ok=True)
+
+# Generate the filename using the current epoch time
+filename = f"render/{int(time.time())}.mp4"
+
+# Create a VideoWriter object
+fourcc = cv2.VideoWriter_fourcc(*"mp4v")
+out = cv2.VideoWriter(filename, fourcc, fps, (width, height))
+
+# Center of the canvas
+cx, cy = width // 2, height // 2
+
+# Initialize the canvas
+canvas = np.zeros((height, width, 3), dtype=np.uint8)
+
+# Number of kaleidoscope segments
+num_segments = random.randint(3, 24)
+
+# Initialize smooth random parameters with smaller, controlled offsets
+random_a_offset = np.random.uniform(-5, 5)
+random_b_offset = np.random.uniform(-5, 5)
+random_rotation_offset = np.random.uniform(-0.02, 0.02)
+random_color_offset = np.random.uniform(-0.02, 0.02)
+
+# Function to calculate smooth color transition with controlled randomness
+def calculate_color(frame_number, random_offset):
+    r = int(np.clip((np.sin(frame_number * 0.02 + random_offset) + 1) * 127.5, 0, 255))
+    g = int(np.clip((np.sin(frame_number * 0.02 + 2 * np.pi / 3 + random_offset) + 1) * 127.5, 0, 255))
+    b = int(np.clip((np.sin(frame_number * 0.02 + 4 * np.pi / 3 + random_offset) + 1) * 127.5, 0, 255))
+    return (r, g, b)
+
+# Function to compute the centers of the mirrored segments with smooth randomness
+def mirrored_segments(x, y):
+    centers = []
+    for i in range(num_segments):
+        angle = i * (2 * np.pi / num_segments)
+        x_rot = int(np.cos(angle) * (x - cx) - np.sin(angle) * (y - cy) + cx)
+        y_rot = int(np.sin(angle) * (x - cx) + np.cos(angle) * (y - cy) + cy)
+        centers.append((x_rot, y_rot))
+    return centers
+
+# Coverage masks of the static group, keyed by (num_copies, brush_size). Static
+# geometry is not detected at run time: the polar copies and the center pattern
+# only depend on how many copies there are and on the brush size, so that group
+# is known to be static and the moving brush is known not to be. The key space
+# is small enough to keep every mask. Masks are cropped to the box around their
+# circles and kept unpacked, so a hit costs no decoding (about 0.5 MB each,
+# under 200 MB for all of them).
+max_cached_masks = (12 - 5 + 1) * (max_brush_size - min_brush_size + 1)
+mask_cache = OrderedDict()
+
+# Buffer the masked fills take their solid color from
+solid = np.zeros((height, width, 3), dtype=np.uint8)
+
+# Function to build the coverage mask of a group of circles
+def build_mask(centers, brush_size):
+    points = np.array(centers)
+    x0, y0 = np.maximum(points.min(axis=0) - brush_size, 0)
+    x1, y1 = np.minimum(points.max(axis=0) + brush_size + 1, (width, height))
+    mask = np.zeros((max(y1 - y0, 0), max(x1 - x0, 0)), dtype=np.uint8)
+    for x, y in centers:
+        cv2.circle(mask, (x - x0, y - y0), brush_size, 1, -1)
+    return slice(y0, y1), slice(x0, x1), mask
+
+# Function to draw the moving brush: it changes every frame, so it is never cached
+def draw_circles(canvas, centers, color, brush_size):
+    for center in centers:
+        cv2.circle(canvas, center, brush_size, color, -1)
+
+# Function to compute the centers of the static group: polar copies around the
+# center, then the original pattern in the center last so it stays on top. The
+# copies and the center share the frame's color, so they form one group.
+def static_centers(num_copies):
+    centers = []
+    for i in range(num_copies):
+        theta = i * (2 * np.pi / num_copies)
+        copy_x = int(cx + (width // 4) * np.cos(theta))
+        copy_y = int(cy + (width // 4) * np.sin(theta))
+        centers += mirrored_segments(copy_x, copy_y)
+    return centers + mirrored_segments(cx, cy)
+
+# Function to draw the static group in one color from its cached mask, building
+# the mask the first time its key is seen; returns whether the mask was cached
+def draw_static(canvas, num_copies, color, brush_size):
+    key = (num_copies, brush_size)
+    hit = key in mask_cache
+    if not hit:
+        mask_cache[key] = build_mask(static_centers(num_copies), brush_size)
+        if len(mask_cache) > max_cached_masks:
+            mask_cache.popitem(last=False)
+    mask_cache.move_to_end(key)
+    rows, columns, mask = mask_cache[key]
+    fill = solid[rows, columns]
+    cv2.rectangle(fill, (0, 0), (fill.shape[1], fill.shape[0]), color, -1)
+    cv2.copyTo(fill, mask, canvas[rows, columns])
+    return hit
+
+# Dampening function to slow down the motion over time
+def dampening_factor(frame_number):
+    return 1 - np.clip(frame_number / total_frames, 0, 0.9)
+
+# Start time of rendering
+start_time = time.time()
+cache_hits = 0
+
+for frame_number in range(total_frames):
+    # Apply dampening factor to slow down parameters over time
+    damp_factor = dampening_factor(frame_number)
+
+    # Smoothly vary elliptic parameters over time with added offsets
+    max_a = width * 0.2 * np.abs(np.sin(frame_number * 0.01 * damp_factor + random_a_offset))  # Adjusted semi-major axis
+    max_b = height * 0.1 + 25 * np.cos(frame_number * 0.01 * damp_factor + random_b_offset)  # Adjusted semi-minor axis
+    angle_variation = 0.015 * damp_factor + 0.001 * np.sin(frame_number * 0.005 * damp_factor)  # Smooth angle variation
+
+    a = max_a  # Keep the semi-major axis as is for maximum radius
+    b = max_b * np.abs(np.cos(frame_number * 0.01 * damp_factor))
+    angle = frame_number * angle_variation  # Angle with slight variation
+
+    # Calculate the position on the ellipse
+    x = int(cx + a * np.cos(angle))
+    y = int(cy + b * np.sin(angle))
+
+    # Rotate the ellipse around the center with smooth randomness
+    rotation_angle = frame_number * 0.01 * damp_factor + random_rotation_offset
+    x_rot = int(np.cos(rotation_angle) * (x - cx) - np.sin(rotation_angle) * (y - cy) + cx)
+    y_rot = int(np.sin(rotation_angle) * (x - cx) + np.cos(rotation_angle) * (y - cy) + cy)
+
+    # Calculate the color for this frame with smooth randomness
+    color = calculate_color(frame_number, random_color_offset)
+
+    # Smoothly randomize brush size within a controlled range
+    brush_size = int(min_brush_size + (max_brush_size - min_brush_size) * (0.5 + 0.5 * np.sin(frame_number * 0.01)))
+
+    # Draw the brush and its mirrored segments on the canvas
+    draw_circles(canvas, mirrored_segments(x_rot, y_rot), color, brush_size)
+
+    # Create polar copies around the center and the original pattern on top
+    num_copies = random.randint(5, 12)
+    if draw_static(canvas, num_copies, color, brush_size):
+        cache_hits += 1
+
+    # Write the frame to the video file
+    out.write(canvas)
+
+    # Calculate statistics every second (every 'fps' frames)
+    if frame_number % fps == 0:
+        elapsed_time = time.time() - start_time
+        frames_remaining = total_frames - frame_number
+        time_remaining = (frames_remaining / fps) / 60  # In minutes
+        estimated_finish = time.time() + frames_remaining / fps
+        percentage_complete = (frame_number / total_frames) * 100
+
+        print(f"Time Elapsed: {elapsed_time:.2f} seconds")
+        print(f"Time Remaining: {time_remaining:.2f} minutes")
+        print(f"Estimated Time of Finish: {time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(estimated_finish))}")
+        print(f"Completion: {percentage_complete:.2f}%")
+        print(f"Cached Masks: {len(mask_cache)}, Cache Hits: {cache_hits} of {frame_number + 1} frames\n")
+
+# Release the VideoWriter object
+out.release()
+
+print(f"Video saved as {filename}")
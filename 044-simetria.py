@@ -0,0 +1,167 @@
+import cv2
+import numpy as np
+import os
+import time
+import random
+
+# Constants
+width, height = 1280, 720
+fps = 60
+duration_seconds = 60 * 1  # Duration of the video in seconds
+min_brush_size, max_brush_size = 15, 60  # Variable brush size range
+
+# Symmetry: "rotational" repeats one wedge around the center, "dihedral" also
+# mirrors it inside every wedge (a kaleidoscope with mirrors)
+symmetry = "dihedral"
+
+# Calculate the total number of frames
+total_frames = fps * duration_seconds
+
+# Create a render directory if it doesn't exist
+os.makedirs("render", exist_ok=True)
+
+# Generate the filename using the current epoch time
+filename = f"render/{int(time.time())}.mp4"
+
+# Create a VideoWriter object
+fourcc = cv2.VideoWriter_fourcc(*"mp4v")
+out = cv2.VideoWriter(filename, fourcc, fps, (width, height))
+
+# Center of the canvas
+cx, cy = width // 2, height // 2
+
+# Initialize the canvas: only the fundamental wedge of it is ever shown, and the
+# frame is built from it with cv2.remap
+canvas = np.zeros((height, width, 3), dtype=np.uint8)
+frame = np.zeros((height, width, 3), dtype=np.uint8)
+
+# Number of kaleidoscope segments
+num_segments = random.randint(3, 24)
+
+# Initialize smooth random parameters with smaller, controlled offsets
+random_a_offset = np.random.uniform(-5, 5)
+random_b_offset = np.random.uniform(-5, 5)
+random_rotation_offset = np.random.uniform(-0.02, 0.02)
+random_color_offset = np.random.uniform(-0.02, 0.02)
+
+# Function to calculate smooth color transition with controlled randomness
+def calculate_color(frame_number, random_offset):
+    r = int(np.clip((np.sin(frame_number * 0.02 + random_offset) + 1) * 127.5, 0, 255))
+    g = int(np.clip((np.sin(frame_number * 0.02 + 2 * np.pi / 3 + random_offset) + 1) * 127.5, 0, 255))
+    b = int(np.clip((np.sin(frame_number * 0.02 + 4 * np.pi / 3 + random_offset) + 1) * 127.5, 0, 255))
+    return (r, g, b)
+
+# Symmetry maps, cached per (width, height, num_segments, symmetry)
+symmetry_maps = {}
+
+# Function to build (or fetch) the fixed-point maps that send every pixel of the
+# frame to the point of the fundamental wedge it repeats
+def get_symmetry_maps(width, height, num_segments, symmetry):
+    key = (width, height, num_segments, symmetry)
+    if key not in symmetry_maps:
+        wedge = 2 * np.pi / num_segments
+        cx, cy = width // 2, height // 2  # Center of this frame size
+        dx, dy = np.meshgrid(np.arange(width, dtype=np.float64) - cx, np.arange(height, dtype=np.float64) - cy)
+        radius = np.sqrt(dx**2 + dy**2)
+        theta = np.mod(np.arctan2(dy, dx), wedge)
+        if symmetry == "dihedral":
+            # Fold the second half of every wedge back onto the first
+            theta = np.where(theta > wedge / 2, wedge - theta, theta)
+        map_x = (cx + radius * np.cos(theta)).astype(np.float32)
+        map_y = (cy + radius * np.sin(theta)).astype(np.float32)
+        symmetry_maps[key] = cv2.convertMaps(map_x, map_y, cv2.CV_16SC2)
+    return symmetry_maps[key]
+
+# Function to draw only the copies of a stamp that reach the fundamental wedge,
+# instead of all num_segments of them; returns how many were drawn
+def draw_wedge_segments(x, y, canvas, color, brush_size):
+    wedge = 2 * np.pi / num_segments
+    shown = wedge / 2 if symmetry == "dihedral" else wedge
+    radius = np.hypot(x - cx, y - cy)
+    phi = np.arctan2(y - cy, x - cx)
+
+    # Rotated copies, plus their reflections for dihedral symmetry
+    angles = phi + np.arange(num_segments) * wedge
+    if symmetry == "dihedral":
+        angles = np.concatenate([angles, -phi + np.arange(num_segments) * wedge])
+
+    # A copy reaches the wedge if its angular reach overlaps [0, shown]; a pixel
+    # of margin covers the rounding of the stamp and of the maps
+    if radius <= brush_size + 2:
+        reaching = angles
+    else:
+        reach = np.arcsin((brush_size + 2) / radius)
+        offset = np.mod(angles - shown / 2, 2 * np.pi)
+        distance = np.minimum(offset, 2 * np.pi - offset)
+        reaching = angles[distance <= shown / 2 + reach]
+
+    for angle in reaching.tolist():
+        x_rot = int(cx + radius * np.cos(angle))
+        y_rot = int(cy + radius * np.sin(angle))
+        cv2.circle(canvas, (x_rot, y_rot), brush_size, color, -1)
+    return len(reaching)
+
+# Dampening function to slow down the motion over time
+def dampening_factor(frame_number):
+    return 1 - np.clip(frame_number / total_frames, 0, 0.9)
+
+# Maps for this resolution, segment count and symmetry
+map_xy, map_fraction = get_symmetry_maps(width, height, num_segments, symmetry)
+
+# Start time of rendering
+start_time = time.time()
+total_stamps = 0
+
+for frame_number in range(total_frames):
+    # Apply dampening factor to slow down parameters over time
+    damp_factor = dampening_factor(frame_number)
+
+    # Smoothly vary elliptic parameters over time with added offsets
+    max_a = width * 0.2 * np.abs(np.sin(frame_number * 0.01 * damp_factor + random_a_offset))  # Adjusted semi-major axis
+    max_b = height * 0.1 + 25 * np.cos(frame_number * 0.01 * damp_factor + random_b_offset)  # Adjusted semi-minor axis
+    angle_variation = 0.015 * damp_factor + 0.001 * np.sin(frame_number * 0.005 * damp_factor)  # Smooth angle variation
+
+    a = max_a  # Keep the semi-major axis as is for maximum radius
+    b = max_b * np.abs(np.cos(frame_number * 0.01 * damp_factor))
+    angle = frame_number * angle_variation  # Angle with slight variation
+
+    # Calculate the position on the ellipse
+    x = int(cx + a * np.cos(angle))
+    y = int(cy + b * np.sin(angle))
+
+    # Rotate the ellipse around the center with smooth randomness
+    rotation_angle = frame_number * 0.01 * damp_factor + random_rotation_offset
+    x_rot = int(np.cos(rotation_angle) * (x - cx) - np.sin(rotation_angle) * (y - cy) + cx)
+    y_rot = int(np.sin(rotation_angle) * (x - cx) + np.cos(rotation_angle) * (y - cy) + cy)
+
+    # Calculate the color for this frame with smooth randomness
+    color = calculate_color(frame_number, random_color_offset)
+
+    # Smoothly randomize brush size within a controlled range
+    brush_size = int(min_brush_size + (max_brush_size - min_brush_size) * (0.5 + 0.5 * np.sin(frame_number * 0.01)))
+
+    # Draw the brush into the fundamental wedge of the canvas
+    total_stamps += draw_wedge_segments(x_rot, y_rot, canvas, color, brush_size)
+
+    # Repeat the wedge around the center and write the frame to the video file
+    cv2.remap(canvas, map_xy, map_fraction, cv2.INTER_NEAREST, dst=frame)
+    out.write(frame)
+
+    # Calculate statistics every second (every 'fps' frames)
+    if frame_number % fps == 0:
+        elapsed_time = time.time() - start_time
+        frames_remaining = total_frames - frame_number
+        time_remaining = (frames_remaining / fps) / 60  # In minutes
+        estimated_finish = time.time() + frames_remaining / fps
+        percentage_complete = (frame_number / total_frames) * 100
+
+        print(f"Time Elapsed: {elapsed_time:.2f} seconds")
+        print(f"Time Remaining: {time_remaining:.2f} minutes")
+        print(f"Estimated Time of Finish: {time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(estimated_finish))}")
+        print(f"Completion: {percentage_complete:.2f}%")
+        print(f"Stamps Drawn: {total_stamps} ({total_stamps / (frame_number + 1):.2f} per frame)\n")
+
+# Release the VideoWriter object
+out.release()
+
+print(f"Video saved as {filename}")
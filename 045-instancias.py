@@ -0,0 +1,164 @@
+import cv2
+import numpy as np
+import os
+import time
+import random
+
+# Constants
+width, height = 1280, 720
+fps = 60
+duration_seconds = 60 * 1  # Duration of the video in seconds
+min_brush_size, max_brush_size = 5, 20  # Variable brush size range
+
+# Calculate the total number of frames
+total_frames = fps * duration_seconds
+
+# Create a render directory if it doesn't exist
+os.makedirs("render", exist_ok=True)
+
+# Generate the filename using the current epoch time
+filename = f"render/{int(time.time())}.mp4"
+
+# Create a VideoWriter object
+fourcc = cv2.VideoWriter_fourcc(*"mp4v")
+out = cv2.VideoWriter(filename, fourcc, fps, (width, height))
+
+# Center of the canvas
+cx, cy = width // 2, height // 2
+
+# Number of kaleidoscope segments
+num_segments = random.randint(3, 24)
+
+# Number of brushes
+num_brushes = 25  # Adjust as needed for complexity
+brush_index = np.arange(num_brushes)
+
+# Initialize smooth random parameters with smaller, controlled offsets
+random_a_offset = np.random.uniform(-5, 5)
+random_b_offset = np.random.uniform(-5, 5)
+random_rotation_offset = np.random.uniform(-0.02, 0.02)
+random_color_offset = np.random.uniform(-0.02, 0.02)
+
+# Every level of the scene is a stack of 2x3 affine matrices, shape (k, 2, 3)
+
+# Function to build the rotations of a level around a point
+def rotation_level(angles, px, py):
+    cos_a, sin_a = np.cos(angles), np.sin(angles)
+    return np.stack([
+        np.stack([cos_a, -sin_a, px - cos_a * px + sin_a * py], axis=-1),
+        np.stack([sin_a, cos_a, py - sin_a * px - cos_a * py], axis=-1),
+    ], axis=1)
+
+# Function to build the translations of a level
+def translation_level(dx, dy):
+    level = np.zeros((len(dx), 2, 3))
+    level[:, 0, 0] = level[:, 1, 1] = 1
+    level[:, 0, 2], level[:, 1, 2] = dx, dy
+    return level
+
+# Function to compose two levels: every parent matrix applied after every child
+# matrix, shape (parents * children, 2, 3) with the parents varying slowest
+def compose(parents, children):
+    linear = np.einsum("pij,cjk->pcik", parents[:, :, :2], children[:, :, :2])
+    offset = np.einsum("pij,cj->pci", parents[:, :, :2], children[:, :, 2]) + parents[:, None, :, 2]
+    return np.concatenate([linear, offset[..., None]], axis=-1).reshape(-1, 2, 3)
+
+# The segment rotations never change, so that level is built once per scene
+segment_level = rotation_level(np.arange(num_segments) * (2 * np.pi / num_segments), cx, cy)
+
+# Composed instance stacks for each number of polar copies, built the first time
+# that number comes up: the copies first, then the original pattern in the center
+# last to ensure it stays on top
+instance_stacks = {}
+
+def get_instances(num_copies):
+    if num_copies not in instance_stacks:
+        theta = np.arange(num_copies) * (2 * np.pi / num_copies)
+        copy_x = (cx + (width // 4) * np.cos(theta)).astype(int)
+        copy_y = (cy + (width // 4) * np.sin(theta)).astype(int)
+        copy_level = translation_level(np.append(copy_x - cx, 0), np.append(copy_y - cy, 0))
+        instance_stacks[num_copies] = compose(copy_level, segment_level)
+    return instance_stacks[num_copies]
+
+# Function to calculate smooth color transition for all brushes at once
+def calculate_colors(frame_numbers, random_offset):
+    phase = frame_numbers[:, None] * 0.02 + np.array([0, 2 * np.pi / 3, 4 * np.pi / 3]) + random_offset
+    return np.clip((np.sin(phase) + 1) * 127.5, 0, 255).astype(np.int64)
+
+# Function to place every brush under every instance in one matrix multiply;
+# returns the stamp centers, shape (copies + 1, brushes, segments, 2), in drawing order
+def transform_brushes(instances, x, y):
+    points = np.stack([x, y, np.ones_like(x)], axis=-1)  # (brushes, 3)
+    centers = np.einsum("nij,bj->nbi", instances, points)
+    return centers.reshape(-1, num_segments, num_brushes, 2).transpose(0, 2, 1, 3)
+
+# Dampening function to slow down the motion over time
+def dampening_factor(frame_number):
+    return 1 - np.clip(frame_number / total_frames, 0, 0.9)
+
+# Start time of rendering
+start_time = time.time()
+
+for frame_number in range(total_frames):
+    # Clear the canvas for each frame
+    canvas = np.zeros((height, width, 3), dtype=np.uint8)
+
+    # Apply dampening factor to slow down parameters over time
+    damp_factor = dampening_factor(frame_number)
+
+    # Smoothly vary elliptic parameters of every brush with added offsets
+    max_a = width * 0.2 * np.abs(np.sin(frame_number * 0.01 * damp_factor + random_a_offset + brush_index))
+    max_b = height * 0.1 + 25 * np.cos(frame_number * 0.01 * damp_factor + random_b_offset + brush_index)
+    angle_variation = 0.015 * damp_factor + 0.001 * np.sin(frame_number * 0.005 * damp_factor)
+
+    a = max_a
+    b = max_b * np.abs(np.cos(frame_number * 0.01 * damp_factor + brush_index))
+    angle = frame_number * angle_variation + brush_index
+
+    # Calculate the positions on the ellipses
+    x = (cx + a * np.cos(angle)).astype(int)
+    y = (cy + b * np.sin(angle)).astype(int)
+
+    # Rotate the ellipses around the center with smooth randomness
+    rotation_angle = frame_number * 0.01 * damp_factor + random_rotation_offset + brush_index
+    x_rot = (np.cos(rotation_angle) * (x - cx) - np.sin(rotation_angle) * (y - cy) + cx).astype(int)
+    y_rot = (np.sin(rotation_angle) * (x - cx) + np.cos(rotation_angle) * (y - cy) + cy).astype(int)
+
+    # Calculate the colors for this frame with smooth randomness
+    colors = calculate_colors(frame_number + brush_index * 100, random_color_offset).tolist()
+
+    # Smoothly randomize brush sizes within a controlled range
+    brush_size = (min_brush_size + (max_brush_size - min_brush_size) * (0.5 + 0.5 * np.sin(frame_number * 0.01 + brush_index))).astype(int)
+
+    # Create polar copies around the center and transform every brush at once
+    num_copies = random.randint(5, 12)
+    centers = transform_brushes(get_instances(num_copies), x_rot, y_rot).astype(int)
+
+    # Skip the stamps that are entirely off the canvas, then draw the rest in order
+    radius = brush_size[None, :, None]
+    visible = (centers[..., 0] + radius >= 0) & (centers[..., 0] - radius < width) & (centers[..., 1] + radius >= 0) & (centers[..., 1] - radius < height)
+    copy, brush, segment = np.nonzero(visible)
+    for (x_stamp, y_stamp), index in zip(centers[copy, brush, segment].tolist(), brush.tolist()):
+        cv2.circle(canvas, (x_stamp, y_stamp), int(brush_size[index]), colors[index], -1)
+
+    # Write the frame to the video file
+    out.write(canvas)
+
+    # Calculate statistics every second (every 'fps' frames)
+    if frame_number % fps == 0:
+        elapsed_time = time.time() - start_time
+        frames_remaining = total_frames - frame_number
+        time_remaining = (frames_remaining / fps) / 60  # In minutes
+        estimated_finish = time.time() + frames_remaining / fps
+        percentage_complete = (frame_number / total_frames) * 100
+
+        print(f"Time Elapsed: {elapsed_time:.2f} seconds")
+        print(f"Time Remaining: {time_remaining:.2f} minutes")
+        print(f"Estimated Time of Finish: {time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(estimated_finish))}")
+        print(f"Completion: {percentage_complete:.2f}%")
+        print(f"Stamps Drawn: {len(copy)} of {centers[..., 0].size}\n")
+
+# Release the VideoWriter object
+out.release()
+
+print(f"Video saved as {filename}")
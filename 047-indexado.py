@@ -0,0 +1,176 @@
+import cv2
+import numpy as np
+import os
+import time
+import sys
+
+# Constants
+width, height = 3840, 2160
+fps = 60
+duration_seconds = 60 * 60  # Duration of the video in seconds
+brush_size = 30
+
+# Indexed color: the canvas holds palette indices (8 or 16 bits) and the colors
+# are only filled in when a frame is written. A gradient palette file can be
+# given as the first argument, otherwise the sine colors are used.
+index_bits = 8
+palette_file = sys.argv[1] if len(sys.argv) > 1 else None
+
+# Calculate the total number of frames
+total_frames = fps * duration_seconds
+
+# Create a render directory if it doesn't exist
+os.makedirs("render", exist_ok=True)
+
+# Generate the filename using the current epoch time
+filename = f"render/{int(time.time())}.mp4"
+
+# Create a VideoWriter object
+fourcc = cv2.VideoWriter_fourcc(*"mp4v")
+out = cv2.VideoWriter(filename, fourcc, fps, (width, height))
+
+# Initial brush position, direction, and speed
+x, y = width // 2, height // 2
+speed = 5
+direction = np.random.uniform(0, 2 * np.pi)  # Random direction in radians
+
+# Function to update direction smoothly with a bias towards the center
+def update_direction(x, y, direction, rate=0.1, center_bias=0.02):
+    direction_change = np.random.uniform(-rate, rate)
+    direction += direction_change
+
+    # Calculate the bias towards the center
+    cx, cy = width // 2, height // 2
+    dx = cx - x
+    dy = cy - y
+    distance = np.sqrt(dx**2 + dy**2)
+
+    # Apply a bias based on the distance from the center
+    bias_direction = np.arctan2(dy, dx)
+    direction = (1 - center_bias) * direction + center_bias * bias_direction
+
+    return direction
+
+# Number of palette entries; index 0 is kept for the black background
+palette_size = 2 ** index_bits
+index_type = np.uint8 if index_bits == 8 else np.uint16
+
+# Initialize the canvas of palette indices and the frame the colors are expanded into
+canvas = np.zeros((height, width), dtype=index_type)
+frame = np.zeros((height, width, 3), dtype=np.uint8)
+
+# Number of kaleidoscope segments
+num_segments = 8
+
+# Function giving the smooth sine colors for an array of phases
+def sine_palette(phase):
+    # Use sine functions to smoothly transition through RGB colors
+    r = (np.sin(phase) + 1) * 127.5
+    g = (np.sin(phase + 2 * np.pi / 3) + 1) * 127.5
+    b = (np.sin(phase + 4 * np.pi / 3) + 1) * 127.5
+    return np.stack([r, g, b], axis=-1)
+
+# Function to load a gradient palette from a text file: one stop per line as
+# "position r g b", positions from 0 to 1 along the turn of the phase
+def gradient_palette(path):
+    stops = np.loadtxt(path, ndmin=2)
+    stops = stops[np.argsort(stops[:, 0])]
+    positions = np.concatenate([stops[-1:, 0] - 1, stops[:, 0], stops[:1, 0] + 1])
+    colors = np.concatenate([stops[-1:, 1:], stops[:, 1:], stops[:1, 1:]])
+
+    # Stops are RGB, the canvas is BGR
+    def palette_function(phase):
+        sample = np.mod(phase / (2 * np.pi), 1)
+        return np.stack([np.interp(sample, positions, colors[:, channel]) for channel in (2, 1, 0)], axis=-1)
+    return palette_function
+
+# Function to build the palette table: entry 0 is black, entries 1 and up sample one turn of the phase
+def build_palette(palette_function):
+    phase = np.arange(palette_size - 1) * (2 * np.pi / (palette_size - 1))
+    palette = np.zeros((palette_size, 3), dtype=np.uint8)
+    palette[1:] = np.clip(palette_function(phase), 0, 255).astype(np.uint8)
+    return palette
+
+# Function to calculate the palette index of the smooth color transition
+def calculate_color_index(frame_number):
+    phase = np.mod(frame_number * 0.02, 2 * np.pi)
+    return 1 + int(round(phase * (palette_size - 1) / (2 * np.pi))) % (palette_size - 1)
+
+# Function to expand a region (x0, y0, x1, y1) of the index canvas into the colors of the palette
+def expand_region(box, palette):
+    x0, y0, x1, y1 = box
+    if index_bits == 8:
+        cv2.applyColorMap(canvas[y0:y1, x0:x1], palette.reshape(256, 1, 3), dst=frame[y0:y1, x0:x1])
+    else:
+        np.take(palette, canvas[y0:y1, x0:x1], axis=0, out=frame[y0:y1, x0:x1])
+
+# Palette of this render. Colors only exist in the frame: switching palettes
+# means expanding the whole canvas once, with no redrawing.
+palette = build_palette(gradient_palette(palette_file) if palette_file else sine_palette)
+
+# Function to draw mirrored segments, returning the boxes they changed
+def draw_mirrored_segments(x, y, canvas, color):
+    boxes = []
+    cx, cy = width // 2, height // 2  # Center of the canvas
+    for i in range(num_segments):
+        angle = i * (2 * np.pi / num_segments)
+        # Calculate the rotated positions
+        x_rot = int(np.cos(angle) * (x - cx) - np.sin(angle) * (y - cy) + cx)
+        y_rot = int(np.sin(angle) * (x - cx) + np.cos(angle) * (y - cy) + cy)
+        cv2.circle(canvas, (x_rot, y_rot), brush_size, color, -1)
+        box = (max(x_rot - brush_size, 0), max(y_rot - brush_size, 0), min(x_rot + brush_size + 1, width), min(y_rot + brush_size + 1, height))
+        # Copies rotated fully off the canvas change nothing, and an empty region
+        # would make cv2.applyColorMap fail
+        if box[2] > box[0] and box[3] > box[1]:
+            boxes.append(box)
+    return boxes
+
+# Start time of rendering
+start_time = time.time()
+
+for frame_number in range(total_frames):
+    # Update the direction smoothly with a bias towards the center
+    direction = update_direction(x, y, direction)
+
+    # Calculate the new position
+    x += int(speed * np.cos(direction))
+    y += int(speed * np.sin(direction))
+
+    # Bounce off the borders
+    if x <= brush_size or x >= width - brush_size:
+        direction = np.pi - direction
+    if y <= brush_size or y >= height - brush_size:
+        direction = -direction
+
+    # Ensure the brush stays within bounds
+    x = np.clip(x, brush_size, width - brush_size)
+    y = np.clip(y, brush_size, height - brush_size)
+
+    # Calculate the palette index of the color for this frame
+    color = calculate_color_index(frame_number)
+
+    # Draw the brush and its mirrored segments on the canvas
+    boxes = draw_mirrored_segments(x, y, canvas, color)
+
+    # Expand the changed indices to colors and write the frame to the video file
+    for box in boxes:
+        expand_region(box, palette)
+    out.write(frame)
+
+    # Calculate statistics every second (every 'fps' frames)
+    if frame_number % fps == 0:
+        elapsed_time = time.time() - start_time
+        frames_remaining = total_frames - frame_number
+        time_remaining = (frames_remaining / fps) / 60  # In minutes
+        estimated_finish = time.time() + frames_remaining / fps
+        percentage_complete = (frame_number / total_frames) * 100
+
+        print(f"Time Elapsed: {elapsed_time:.2f} seconds")
+        print(f"Time Remaining: {time_remaining:.2f} minutes")
+        print(f"Estimated Time of Finish: {time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(estimated_finish))}")
+        print(f"Completion: {percentage_complete:.2f}%\n")
+
+# Release the VideoWriter object
+out.release()
+
+print(f"Video saved as {filename}")
@@ -0,0 +1,162 @@
+import cv2
+import numpy as np
+import os
+import time
+import random
+import sys
+
+# Constants
+width, height = 3840, 2160
+fps = 60
+duration_seconds = int(sys.argv[1]) if len(sys.argv) > 1 else 60 * 60  # Duration of the video in seconds
+min_brush_size, max_brush_size = 15, 60  # Variable brush size range
+
+# Calculate the total number of frames
+total_frames = fps * duration_seconds
+
+# Create a render directory if it doesn't exist
+os.makedirs("render", exist_ok=True)
+
+# Generate the filename using the current epoch time
+filename = f"render/{int(time.time())}.mp4"
+
+# Create a VideoWriter object
+fourcc = cv2.VideoWriter_fourcc(*"mp4v")
+out = cv2.VideoWriter(filename, fourcc, fps, (width, height))
+
+# Center of the canvas
+cx, cy = width // 2, height // 2
+
+# Initialize the canvas
+canvas = np.zeros((height, width, 3), dtype=np.uint8)
+
+# Number of kaleidoscope segments
+num_segments = random.randint(3, 24)
+
+# Initialize smooth random parameters with smaller, controlled offsets
+random_a_offset = np.random.uniform(-5, 5)
+random_b_offset = np.random.uniform(-5, 5)
+random_rotation_offset = np.random.uniform(-0.02, 0.02)
+random_color_offset = np.random.uniform(-0.02, 0.02)
+
+# Easing curves for the segment between two keyframes, t going from 0 to 1
+easings = {
+    "linear": lambda t: t,
+    "ease_in": lambda t: t * t,
+    "ease_out": lambda t: 1 - (1 - t) * (1 - t),
+    "ease_in_out": lambda t: t * t * (3 - 2 * t),
+    "hold": lambda t: np.zeros_like(t),
+}
+
+# A timeline is an ordered dict of parameters. Each parameter is a function of the
+# values evaluated so far: "frame", "seconds" and "position" (0 at the start of the
+# piece, 1 at the end) for every frame, plus the parameters defined above it.
+
+# Function to define a parameter by keyframes at positions of the piece, so it
+# follows any duration. Keys are (position, value) or (position, value, easing),
+# the easing shaping the way to the next key.
+def keyframes(*keys):
+    positions = np.array([key[0] for key in keys], dtype=np.float64)
+    values = np.array([key[1] for key in keys], dtype=np.float64)
+    curves = [key[2] if len(key) > 2 else "linear" for key in keys]
+
+    def evaluate(values_so_far):
+        position = values_so_far["position"]
+        segment = np.clip(np.searchsorted(positions, position, side="right") - 1, 0, len(keys) - 2)
+        start, end = positions[segment], positions[segment + 1]
+        t = np.clip((position - start) / (end - start), 0, 1)
+        eased = np.empty_like(t)
+        for index, curve in enumerate(curves[:-1]):
+            in_segment = segment == index
+            eased[in_segment] = easings[curve](t[in_segment])
+        return values[segment] + (values[segment + 1] - values[segment]) * eased
+    return evaluate
+
+# Function to define a parameter by an expression over the values so far
+def expression(function):
+    return function
+
+# Function to evaluate a whole timeline for a range of frames at once
+def evaluate_timeline(timeline, frame_numbers):
+    values = {
+        "frame": frame_numbers,
+        "seconds": frame_numbers / fps,
+        "position": frame_numbers / total_frames,
+    }
+    for name, parameter in timeline.items():
+        values[name] = parameter(values)
+    return values
+
+# Function to calculate smooth color transition with controlled randomness for arrays of frames
+def calculate_colors(frame_numbers, random_offset):
+    phase = frame_numbers[:, None] * 0.02 + np.array([0, 2 * np.pi / 3, 4 * np.pi / 3]) + random_offset
+    return np.clip((np.sin(phase) + 1) * 127.5, 0, 255).astype(np.int64)
+
+# Timeline of the piece: the same motion as the growing-radius orbit
+timeline = {
+    # Dampening to slow down the motion over time
+    "damp_factor": keyframes((0, 1), (0.9, 0.1), (1, 0.1)),
+
+    # max_a grows linearly from 0.2 to 0.6 of the screen width over the piece
+    "max_a": keyframes((0, width * 0.2), (1, width * 0.6)),
+    "max_b": expression(lambda v: height * 0.1 + 25 * np.cos(v["frame"] * 0.01 * v["damp_factor"] + random_b_offset)),
+    "angle_variation": expression(lambda v: 0.015 * v["damp_factor"] + 0.001 * np.sin(v["frame"] * 0.005 * v["damp_factor"])),
+
+    # Position on the ellipse
+    "b": expression(lambda v: v["max_b"] * np.abs(np.cos(v["frame"] * 0.01 * v["damp_factor"]))),
+    "angle": expression(lambda v: v["frame"] * v["angle_variation"]),
+    "x": expression(lambda v: (cx + v["max_a"] * np.cos(v["angle"])).astype(int)),
+    "y": expression(lambda v: (cy + v["b"] * np.sin(v["angle"])).astype(int)),
+
+    # Rotate the ellipse around the center with smooth randomness
+    "rotation_angle": expression(lambda v: v["frame"] * 0.01 * v["damp_factor"] + random_rotation_offset),
+    "x_rot": expression(lambda v: (np.cos(v["rotation_angle"]) * (v["x"] - cx) - np.sin(v["rotation_angle"]) * (v["y"] - cy) + cx).astype(int)),
+    "y_rot": expression(lambda v: (np.sin(v["rotation_angle"]) * (v["x"] - cx) + np.cos(v["rotation_angle"]) * (v["y"] - cy) + cy).astype(int)),
+
+    # Color and brush size
+    "color": expression(lambda v: calculate_colors(v["frame"], random_color_offset)),
+    "brush_size": expression(lambda v: (min_brush_size + (max_brush_size - min_brush_size) * (0.5 + 0.5 * np.sin(v["frame"] * 0.01))).astype(int)),
+}
+
+# Function to draw mirrored segments with smooth randomness
+def draw_mirrored_segments(x, y, canvas, color, brush_size):
+    for i in range(num_segments):
+        angle = i * (2 * np.pi / num_segments)
+        x_rot = int(np.cos(angle) * (x - cx) - np.sin(angle) * (y - cy) + cx)
+        y_rot = int(np.sin(angle) * (x - cx) + np.cos(angle) * (y - cy) + cy)
+        cv2.circle(canvas, (x_rot, y_rot), brush_size, color, -1)
+
+# Evaluate every parameter for the whole piece; each frame is then a lookup
+parameters = evaluate_timeline(timeline, np.arange(total_frames))
+x_rots = parameters["x_rot"].tolist()
+y_rots = parameters["y_rot"].tolist()
+colors = [tuple(color) for color in parameters["color"].tolist()]
+brush_sizes = parameters["brush_size"].tolist()
+
+# Start time of rendering
+start_time = time.time()
+
+for frame_number in range(total_frames):
+    # Draw the brush and its mirrored segments on the canvas
+    draw_mirrored_segments(x_rots[frame_number], y_rots[frame_number], canvas, colors[frame_number], brush_sizes[frame_number])
+
+    # Write the frame to the video file
+    out.write(canvas)
+
+    # Calculate statistics every second (every 'fps' frames)
+    if frame_number % fps == 0:
+        elapsed_time = time.time() - start_time
+        frames_remaining = total_frames - frame_number
+        time_remaining = (frames_remaining / fps) / 60  # In minutes
+        estimated_finish = time.time() + frames_remaining / fps
+        percentage_complete = (frame_number / total_frames) * 100
+
+        print(f"Time Elapsed: {elapsed_time:.2f} seconds")
+        print(f"Time Remaining: {time_remaining:.2f} minutes")
+        print(f"Estimated Time of Finish: {time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(estimated_finish))}")
+        print(f"Completion: {percentage_complete:.2f}%\n")
+
+# Release the VideoWriter object
+out.release()
+
+print(f"Video saved as {filename}")
@@ -0,0 +1,158 @@
+import cv2
+import numpy as np
+import os
+import time
+import random
+import shutil
+import subprocess
+
+# Constants
+width, height = 1280, 720
+fps = 60
+duration_seconds = 60 * 60  # Duration of the video in seconds
+min_brush_size, max_brush_size = 15, 60  # Variable brush size range
+
+# Loop settings: only loop_seconds are rendered, and that loop is repeated up to
+# duration_seconds when the video is assembled
+loop_seconds = 120
+
+# Calculate the total number of frames and the frames of one loop
+total_frames = fps * duration_seconds
+loop_frames = fps * loop_seconds
+
+# Create a render directory if it doesn't exist
+os.makedirs("render", exist_ok=True)
+
+# Generate the filenames using the current epoch time
+filename = f"render/{int(time.time())}.mp4"
+loop_filename = f"render/{int(time.time())}-loop.mp4"
+
+# Create a VideoWriter object for the loop
+fourcc = cv2.VideoWriter_fourcc(*"mp4v")
+out = cv2.VideoWriter(loop_filename, fourcc, fps, (width, height))
+
+# Center of the canvas
+cx, cy = width // 2, height // 2
+
+# Number of kaleidoscope segments
+num_segments = random.randint(3, 24)
+
+# Initialize smooth random parameters with smaller, controlled offsets
+random_a_offset = np.random.uniform(-5, 5)
+random_b_offset = np.random.uniform(-5, 5)
+random_rotation_offset = np.random.uniform(-0.02, 0.02)
+random_color_offset = np.random.uniform(-0.02, 0.02)
+
+# Function to snap a frequency (radians per frame) to the nearest one that
+# completes a whole number of cycles in one loop
+def snap_frequency(frequency):
+    cycles = max(1, round(frequency * loop_frames / (2 * np.pi)))
+    return cycles * 2 * np.pi / loop_frames
+
+# Snapped frequencies of the orbit, the color and the brush size
+ellipse_frequency = snap_frequency(0.01)
+wobble_frequency = snap_frequency(0.005)
+angle_speed = snap_frequency(0.015)
+color_frequency = snap_frequency(0.02)
+
+# Function to calculate smooth color transition with controlled randomness
+def calculate_color(frame_number, random_offset):
+    r = int(np.clip((np.sin(frame_number * color_frequency + random_offset) + 1) * 127.5, 0, 255))
+    g = int(np.clip((np.sin(frame_number * color_frequency + 2 * np.pi / 3 + random_offset) + 1) * 127.5, 0, 255))
+    b = int(np.clip((np.sin(frame_number * color_frequency + 4 * np.pi / 3 + random_offset) + 1) * 127.5, 0, 255))
+    return (r, g, b)
+
+# Function to draw mirrored segments with smooth randomness
+def draw_mirrored_segments(x, y, canvas, color, brush_size):
+    for i in range(num_segments):
+        angle = i * (2 * np.pi / num_segments)
+        x_rot = int(np.cos(angle) * (x - cx) - np.sin(angle) * (y - cy) + cx)
+        y_rot = int(np.sin(angle) * (x - cx) + np.cos(angle) * (y - cy) + cy)
+        cv2.circle(canvas, (x_rot, y_rot), brush_size, color, -1)
+
+# Function to repeat the loop up to the full duration. ffmpeg copies the stream
+# without decoding; without it, the loop is decoded and written again.
+def repeat_loop(loop_filename, filename):
+    repeats = -(-total_frames // loop_frames)
+    if shutil.which("ffmpeg"):
+        list_path = filename + ".txt"
+        with open(list_path, "w") as listing:
+            for _ in range(repeats):
+                listing.write(f"file '{os.path.abspath(loop_filename)}'\n")
+        subprocess.run(["ffmpeg", "-y", "-loglevel", "error", "-f", "concat", "-safe", "0", "-i", list_path, "-c", "copy", "-t", str(duration_seconds), filename], check=True)
+        os.remove(list_path)
+        return
+
+    out = cv2.VideoWriter(filename, fourcc, fps, (width, height))
+    written = 0
+    while written < total_frames:
+        capture = cv2.VideoCapture(loop_filename)
+        while written < total_frames:
+            ok, frame = capture.read()
+            if not ok:
+                break
+            out.write(frame)
+            written += 1
+        capture.release()
+    out.release()
+
+# Start time of rendering
+start_time = time.time()
+
+for frame_number in range(loop_frames):
+    # Clear the canvas for each frame to remove trails
+    canvas = np.zeros((height, width, 3), dtype=np.uint8)
+
+    # No dampening: the motion has to end the loop where it started. Smoothly
+    # vary elliptic parameters over time with added offsets
+    max_a = width * 0.6 * np.abs(np.sin(frame_number * ellipse_frequency + random_a_offset))  # Adjusted semi-major axis
+    max_b = height * 0.1 + 25 * np.cos(frame_number * ellipse_frequency + random_b_offset)  # Adjusted semi-minor axis
+
+    a = max_a  # Keep the semi-major axis as is for maximum radius
+    b = max_b * np.abs(np.cos(frame_number * ellipse_frequency))
+
+    # The angle turns at angle_speed plus a smooth variation of 0.001 per frame;
+    # integrating that speed keeps the angle periodic over the loop
+    angle = frame_number * angle_speed - 0.001 / wobble_frequency * np.cos(frame_number * wobble_frequency)
+
+    # Calculate the position on the ellipse
+    x = int(cx + a * np.cos(angle))
+    y = int(cy + b * np.sin(angle))
+
+    # Rotate the ellipse around the center with smooth randomness
+    rotation_angle = frame_number * ellipse_frequency + random_rotation_offset
+    x_rot = int(np.cos(rotation_angle) * (x - cx) - np.sin(rotation_angle) * (y - cy) + cx)
+    y_rot = int(np.sin(rotation_angle) * (x - cx) + np.cos(rotation_angle) * (y - cy) + cy)
+
+    # Calculate the color for this frame with smooth randomness
+    color = calculate_color(frame_number, random_color_offset)
+
+    # Smoothly randomize brush size within a controlled range
+    brush_size = int(min_brush_size + (max_brush_size - min_brush_size) * (0.5 + 0.5 * np.sin(frame_number * ellipse_frequency)))
+
+    # Draw the brush and its mirrored segments on the canvas
+    draw_mirrored_segments(x_rot, y_rot, canvas, color, brush_size)
+
+    # Write the frame to the loop
+    out.write(canvas)
+
+    # Calculate statistics every second (every 'fps' frames)
+    if frame_number % fps == 0:
+        elapsed_time = time.time() - start_time
+        frames_remaining = loop_frames - frame_number
+        time_remaining = (frames_remaining / fps) / 60  # In minutes
+        estimated_finish = time.time() + frames_remaining / fps
+        percentage_complete = (frame_number / loop_frames) * 100
+
+        print(f"Time Elapsed: {elapsed_time:.2f} seconds")
+        print(f"Time Remaining: {time_remaining:.2f} minutes")
+        print(f"Estimated Time of Finish: {time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(estimated_finish))}")
+        print(f"Completion: {percentage_complete:.2f}%\n")
+
+# Release the VideoWriter object and repeat the loop to the full duration
+out.release()
+repeat_loop(loop_filename, filename)
+os.remove(loop_filename)
+
+print(f"Loop of {loop_seconds} seconds rendered in {time.time() - start_time:.2f} seconds")
+print(f"Video saved as {filename}")
@@ -0,0 +1,127 @@
+import cv2
+import numpy as np
+import os
+import time
+
+# Constants
+width, height = 3840, 2160
+fps = 60
+duration_seconds = 60 * 60  # Duration of the video in seconds
+brush_size = 30
+
+# Calculate the total number of frames
+total_frames = fps * duration_seconds
+
+# Create a render directory if it doesn't exist
+os.makedirs("render", exist_ok=True)
+
+# Generate the filename using the current epoch time
+filename = f"render/{int(time.time())}.mp4"
+
+# Create a VideoWriter object
+fourcc = cv2.VideoWriter_fourcc(*"mp4v")
+out = cv2.VideoWriter(filename, fourcc, fps, (width, height))
+
+# Initial brush position, direction, and speed
+speed = 5
+direction = np.random.uniform(0, 2 * np.pi)  # Random direction in radians
+rate = 0.1  # Largest change of direction per frame
+
+# Steps of the walk checked against the step-by-step version before rendering
+verify_steps = 2000
+
+# Function to fold an unbounded coordinate into [low, high] with a triangle wave:
+# walking straight on past a border is the same as bouncing off it
+def fold(coordinate, low, high):
+    span = high - low
+    phase = np.mod(coordinate - low, 2 * span)
+    return low + np.where(phase <= span, phase, 2 * span - phase)
+
+# Function to compute the whole path of the bouncing random walk at once. The
+# direction and position are integrated in unfolded space, where bounces do not
+# exist, and the position is folded back between the borders.
+def simulate_walk(direction, direction_changes):
+    directions = np.cumsum(np.concatenate(([direction], direction_changes)))[1:]
+    x = width // 2 + np.cumsum((speed * np.cos(directions)).astype(np.int64))
+    y = height // 2 + np.cumsum((speed * np.sin(directions)).astype(np.int64))
+    return fold(x, brush_size, width - brush_size), fold(y, brush_size, height - brush_size)
+
+# Function to walk the same path one step at a time, as the earlier pieces do
+def step_walk(direction, direction_changes):
+    x, y = width // 2, height // 2
+    path = []
+    for direction_change in direction_changes:
+        direction += direction_change
+        x += int(speed * np.cos(direction))
+        y += int(speed * np.sin(direction))
+        path.append((int(fold(x, brush_size, width - brush_size)), int(fold(y, brush_size, height - brush_size))))
+    return path
+
+# Initialize the canvas
+canvas = np.zeros((height, width, 3), dtype=np.uint8)
+
+# Number of kaleidoscope segments
+num_segments = 8
+
+# Function to calculate smooth color transition
+def calculate_color(frame_number):
+    # Use sine functions to smoothly transition through RGB colors
+    r = int((np.sin(frame_number * 0.02) + 1) * 127.5)
+    g = int((np.sin(frame_number * 0.02 + 2 * np.pi / 3) + 1) * 127.5)
+    b = int((np.sin(frame_number * 0.02 + 4 * np.pi / 3) + 1) * 127.5)
+    return (r, g, b)
+
+# Function to draw mirrored segments
+def draw_mirrored_segments(x, y, canvas, color):
+    cx, cy = width // 2, height // 2  # Center of the canvas
+    for i in range(num_segments):
+        angle = i * (2 * np.pi / num_segments)
+        # Calculate the rotated positions
+        x_rot = int(np.cos(angle) * (x - cx) - np.sin(angle) * (y - cy) + cx)
+        y_rot = int(np.sin(angle) * (x - cx) + np.cos(angle) * (y - cy) + cy)
+        cv2.circle(canvas, (x_rot, y_rot), brush_size, color, -1)
+
+# Start time of rendering
+start_time = time.time()
+
+# Draw every change of direction up front and simulate the whole walk
+direction_changes = np.random.uniform(-rate, rate, total_frames)
+path_x, path_y = simulate_walk(direction, direction_changes)
+print(f"Simulated {total_frames} steps in {time.time() - start_time:.3f} seconds")
+
+# The vectorized path must match the step-by-step walk exactly
+reference = step_walk(direction, direction_changes[:verify_steps])
+if reference != list(zip(path_x[:verify_steps].tolist(), path_y[:verify_steps].tolist())):
+    raise RuntimeError("The vectorized walk differs from the step-by-step walk")
+path_x, path_y = path_x.tolist(), path_y.tolist()
+
+for frame_number in range(total_frames):
+    # Position of the brush on the precomputed path
+    x, y = path_x[frame_number], path_y[frame_number]
+
+    # Calculate the color for this frame
+    color = calculate_color(frame_number)
+
+    # Draw the brush and its mirrored segments on the canvas
+    draw_mirrored_segments(x, y, canvas, color)
+
+    # Write the frame to the video file
+    out.write(canvas)
+
+    # Calculate statistics every second (every 'fps' frames)
+    if frame_number % fps == 0:
+        elapsed_time = time.time() - start_time
+        frames_remaining = total_frames - frame_number
+        time_remaining = (frames_remaining / fps) / 60  # In minutes
+        estimated_finish = time.time() + frames_remaining / fps
+        percentage_complete = (frame_number / total_frames) * 100
+
+        print(f"Time Elapsed: {elapsed_time:.2f} seconds")
+        print(f"Time Remaining: {time_remaining:.2f} minutes")
+        print(f"Estimated Time of Finish: {time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(estimated_finish))}")
+        print(f"Completion: {percentage_complete:.2f}%\n")
+
+# Release the VideoWriter object
+out.release()
+
+print(f"Video saved as {filename}")
@@ -0,0 +1,190 @@
+import cv2
+import numpy as np
+import os
+import time
+import random
+import sys
+
+# Constants
+width, height = 1280, 720
+fps = 60
+duration_seconds = 60 * 1  # Duration of the video in seconds
+min_brush_size, max_brush_size = 15, 60  # Variable brush size range
+
+# Number of brushes, from the command line (25 gives the squares of the
+# original piece, in colors rounded to the palette below)
+num_brushes = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+
+# Brush sizes shrink as brushes are added so the canvas does not fill up
+brush_scale = max(1, round(5 * np.sqrt(25 / num_brushes)))
+
+# Calculate the total number of frames
+total_frames = fps * duration_seconds
+
+# Create a render directory if it doesn't exist
+os.makedirs("render", exist_ok=True)
+
+# Generate the filename using the current epoch time
+filename = f"render/{int(time.time())}.mp4"
+
+# Create a VideoWriter object
+fourcc = cv2.VideoWriter_fourcc(*"mp4v")
+out = cv2.VideoWriter(filename, fourcc, fps, (width, height))
+
+# Center of the canvas
+cx, cy = width // 2, height // 2
+
+# Number of kaleidoscope segments
+num_segments = random.randint(3, 24)
+
+# Initialize smooth random parameters with smaller, controlled offsets
+random_a_offset = np.random.uniform(-5, 5)
+random_b_offset = np.random.uniform(-5, 5)
+random_rotation_offset = np.random.uniform(-0.02, 0.02)
+random_color_offset = np.random.uniform(-0.02, 0.02)
+
+# Brush state, one contiguous array per field. Each brush follows its own
+# ellipse; the phases were the brush index in the original loop.
+orbit_phase = np.arange(num_brushes, dtype=np.float64)
+rotation_phase = np.arange(num_brushes, dtype=np.float64)
+size_phase = np.arange(num_brushes, dtype=np.float64)
+color_phase = np.arange(num_brushes, dtype=np.float64) * 100
+x = np.zeros(num_brushes, dtype=np.int64)
+y = np.zeros(num_brushes, dtype=np.int64)
+rotation_angle = np.zeros(num_brushes)
+brush_size = np.zeros(num_brushes, dtype=np.int64)
+color_index = np.zeros(num_brushes, dtype=np.int64)
+
+# Segment rotations and the corners of a unit square around its center
+segment_angles = np.arange(num_segments) * (2 * np.pi / num_segments)
+square_corners = np.array([[-1, -1], [1, -1], [1, 1], [-1, 1]])
+
+# Indexed color, as in 047: squares are stamped as palette indices into a
+# single-channel canvas, which fills about twice as fast as a color one, and
+# the colors are filled in once per frame. Entry 0 is the black background,
+# entries 1 and up sample one turn of the color phase, so colors are within
+# a level or two of the exact sine colors rather than identical.
+palette_size = 256
+palette_phase = np.arange(palette_size - 1) * (2 * np.pi / (palette_size - 1)) + random_color_offset
+palette = np.zeros((palette_size, 3), dtype=np.uint8)
+palette[1:] = np.clip((np.sin(palette_phase[:, None] + np.array([0, 2 * np.pi / 3, 4 * np.pi / 3])) + 1) * 127.5, 0, 255)
+canvas = np.zeros((height, width), dtype=np.uint8)
+frame = np.zeros((height, width, 3), dtype=np.uint8)
+
+# Mirrored copies of a brush are spaced 2 * r * sin(pi / segments) apart, so
+# past this distance from the center (per pixel of square diagonal) they cannot
+# overlap and one cv2.fillPoly call can draw them all
+separation = 1 / (2 * np.sin(np.pi / num_segments))
+
+# Dampening function to slow down the motion over time
+def dampening_factor(frame_number):
+    return 1 - np.clip(frame_number / total_frames, 0, 0.9)
+
+# Function to advance every brush to a frame in a few array operations
+def update_brushes(frame_number):
+    # Apply dampening factor to slow down parameters over time
+    damp_factor = dampening_factor(frame_number)
+
+    # Smoothly vary elliptic parameters of every brush with added offsets
+    max_a = width * 0.6 * np.abs(np.sin(frame_number * 0.01 * damp_factor + random_a_offset + orbit_phase))
+    max_b = height * 0.1 + 25 * np.cos(frame_number * 0.01 * damp_factor + random_b_offset + orbit_phase)
+    angle_variation = 0.015 * damp_factor + 0.001 * np.sin(frame_number * 0.005 * damp_factor)
+
+    a = max_a
+    b = max_b * np.abs(np.cos(frame_number * 0.01 * damp_factor + orbit_phase))
+    angle = frame_number * angle_variation + orbit_phase
+
+    # Calculate the positions on the ellipses
+    x[:] = cx + a * np.cos(angle)
+    y[:] = cy + b * np.sin(angle)
+
+    # Rotate the squares around their centers with smooth randomness
+    rotation_angle[:] = frame_number * 0.01 * damp_factor + random_rotation_offset + rotation_phase
+
+    # Calculate the palette indices of the colors with smooth randomness
+    phase = np.mod((frame_number + color_phase) * 0.02, 2 * np.pi)
+    color_index[:] = 1 + np.rint(phase * (palette_size - 1) / (2 * np.pi)).astype(np.int64) % (palette_size - 1)
+
+    # Smoothly randomize brush sizes within a controlled range
+    brush_size[:] = min_brush_size + (max_brush_size - min_brush_size) * (0.5 + 0.5 * np.sin(frame_number * 0.01 + size_phase))
+    brush_size[:] *= brush_scale
+
+# Function to compute the corners of every mirrored, rotated square of a frame,
+# shape (brushes, segments, 4, 2) in drawing order
+def mirrored_squares(x, y, brush_size, rotation_angle):
+    # Rotated positions of every segment, shape (brushes, segments)
+    cos_s, sin_s = np.cos(segment_angles), np.sin(segment_angles)
+    dx, dy = (x - cx)[:, None], (y - cy)[:, None]
+    x_rot = (cos_s * dx - sin_s * dy + cx).astype(np.int64)
+    y_rot = (sin_s * dx + cos_s * dy + cy).astype(np.int64)
+
+    # Rotate each square around its own center and round the corners, as
+    # cv2.getRotationMatrix2D and cv2.transform on integer points do
+    half_size = (brush_size // 2)[:, None, None]
+    alpha = np.cos(np.radians(rotation_angle))[:, None, None]
+    beta = np.sin(np.radians(rotation_angle))[:, None, None]
+    offset_x = square_corners[:, 0] * half_size  # (brushes, 1, 4)
+    offset_y = square_corners[:, 1] * half_size
+    corners_x = x_rot[:, :, None] + alpha * offset_x + beta * offset_y
+    corners_y = y_rot[:, :, None] - beta * offset_x + alpha * offset_y
+    return np.rint(np.stack([corners_x, corners_y], axis=-1)).astype(np.int32)
+
+# Function to stamp the squares of every brush in drawing order, skipping those
+# entirely off the canvas; returns how many were drawn. cv2.fillPoly fills
+# overlapping polygons of one call even-odd, leaving holes, so a brush's copies
+# share one call only when they are far enough apart not to overlap.
+def stamp_squares(canvas, squares, square_indices):
+    low, high = squares.min(axis=2), squares.max(axis=2)
+    visible = (high[:, :, 0] >= 0) & (low[:, :, 0] < width) & (high[:, :, 1] >= 0) & (low[:, :, 1] < height)
+    diagonal = np.sqrt(2) * (high - low).max(axis=(1, 2))
+    distance = np.hypot(*(squares[:, 0].mean(axis=1) - (cx, cy)).T)
+    apart = distance > separation * (diagonal + 2)
+    for polygons, shown, together, index in zip(squares, visible, apart.tolist(), square_indices.tolist()):
+        if not shown.any():
+            continue
+        if together:
+            cv2.fillPoly(canvas, polygons[shown], index)
+        else:
+            for polygon in polygons[shown]:
+                cv2.fillPoly(canvas, [polygon], index)
+    return int(visible.sum())
+
+# Start time of rendering
+start_time = time.time()
+update_time = 0
+
+for frame_number in range(total_frames):
+    # Clear the canvas for each frame to remove trails
+    canvas[:] = 0
+
+    # Advance every brush and build all of its mirrored squares
+    update_start = time.time()
+    update_brushes(frame_number)
+    squares = mirrored_squares(x, y, brush_size, rotation_angle)
+    update_time += time.time() - update_start
+
+    # Stamp every square, each in the palette index of its brush
+    stamped = stamp_squares(canvas, squares, color_index)
+
+    # Expand the indices to colors and write the frame to the video file
+    cv2.applyColorMap(canvas, palette.reshape(256, 1, 3), dst=frame)
+    out.write(frame)
+
+    # Calculate statistics every second (every 'fps' frames)
+    if frame_number % fps == 0:
+        elapsed_time = time.time() - start_time
+        frames_remaining = total_frames - frame_number
+        time_remaining = (frames_remaining / fps) / 60  # In minutes
+        estimated_finish = time.time() + frames_remaining / fps
+        percentage_complete = (frame_number / total_frames) * 100
+
+        print(f"Time Elapsed: {elapsed_time:.2f} seconds")
+        print(f"Time Remaining: {time_remaining:.2f} minutes")
+        print(f"Estimated Time of Finish: {time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(estimated_finish))}")
+        print(f"Completion: {percentage_complete:.2f}%")
+        print(f"Brushes: {num_brushes}, Squares Stamped: {stamped}, Update Time: {update_time / (frame_number + 1) * 1000:.2f} ms per frame\n")
+
+# Release the VideoWriter object
+out.release()
+
+print(f"Video saved as {filename}")
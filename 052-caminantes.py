@@ -0,0 +1,135 @@
+import cv2
+import numpy as np
+import os
+import time
+import sys
+
+# Constants
+width, height = 3840, 2160
+fps = 60
+duration_seconds = 60 * 60  # Duration of the video in seconds
+brush_size = 8
+
+# Number of independent walkers, from the command line
+num_walkers = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+
+# Calculate the total number of frames
+total_frames = fps * duration_seconds
+
+# Create a render directory if it doesn't exist
+os.makedirs("render", exist_ok=True)
+
+# Generate the filename using the current epoch time
+filename = f"render/{int(time.time())}.mp4"
+
+# Create a VideoWriter object
+fourcc = cv2.VideoWriter_fourcc(*"mp4v")
+out = cv2.VideoWriter(filename, fourcc, fps, (width, height))
+
+# Center of the canvas
+cx, cy = width // 2, height // 2
+
+# Walker state, one array per field: every walker starts at the center with its
+# own random direction, speed and direction jitter as in the single-brush walk
+x = np.full(num_walkers, cx, dtype=np.int64)
+y = np.full(num_walkers, cy, dtype=np.int64)
+speed = 5
+direction = np.random.uniform(0, 2 * np.pi, num_walkers)  # Random directions in radians
+
+# Function to update every direction smoothly with a bias towards the center
+def update_directions(x, y, direction, rate=0.1, center_bias=0.02):
+    direction = direction + np.random.uniform(-rate, rate, len(direction))
+
+    # Apply a bias towards the center
+    bias_direction = np.arctan2(cy - y, cx - x)
+    return (1 - center_bias) * direction + center_bias * bias_direction
+
+# Initialize the canvas
+canvas = np.zeros((height, width, 3), dtype=np.uint8)
+
+# Batched stamping: the centers of a frame are marked on a mask and dilated by
+# the brush's own disc, which paints the same pixels as one cv2.circle per center
+brush_disc = np.zeros((2 * brush_size + 1, 2 * brush_size + 1), dtype=np.uint8)
+cv2.circle(brush_disc, (brush_size, brush_size), brush_size, 1, -1)
+# The mask is padded by the brush size, as rotated copies off the canvas may still reach it
+marks = np.zeros((height + 2 * brush_size, width + 2 * brush_size), dtype=np.uint8)
+coverage = marks[brush_size:brush_size + height, brush_size:brush_size + width]
+solid = np.zeros((height, width, 3), dtype=np.uint8)
+
+# Number of kaleidoscope segments
+num_segments = 8
+
+# Function to calculate smooth color transition
+def calculate_color(frame_number):
+    # Use sine functions to smoothly transition through RGB colors
+    r = int((np.sin(frame_number * 0.02) + 1) * 127.5)
+    g = int((np.sin(frame_number * 0.02 + 2 * np.pi / 3) + 1) * 127.5)
+    b = int((np.sin(frame_number * 0.02 + 4 * np.pi / 3) + 1) * 127.5)
+    return (r, g, b)
+
+# Function to draw the mirrored segments of every walker in one batch, all in
+# the color of the frame; returns how many stamps landed on the canvas
+def draw_mirrored_segments(x, y, canvas, color):
+    angles = np.arange(num_segments) * (2 * np.pi / num_segments)
+    x_rot = (np.cos(angles) * (x - cx)[:, None] - np.sin(angles) * (y - cy)[:, None] + cx).astype(np.int64).ravel()
+    y_rot = (np.sin(angles) * (x - cx)[:, None] + np.cos(angles) * (y - cy)[:, None] + cy).astype(np.int64).ravel()
+
+    # Mark the centers whose discs can reach the canvas and grow them into discs
+    inside = (x_rot > -brush_size) & (x_rot < width + brush_size) & (y_rot > -brush_size) & (y_rot < height + brush_size)
+    marks[:] = 0
+    marks[y_rot[inside] + brush_size, x_rot[inside] + brush_size] = 1
+    cv2.dilate(marks, brush_disc, dst=marks)
+
+    # Paint the frame's color through the covered pixels
+    cv2.rectangle(solid, (0, 0), (width, height), color, -1)
+    cv2.copyTo(solid, coverage, canvas)
+    return int(inside.sum())
+
+# Start time of rendering
+start_time = time.time()
+
+for frame_number in range(total_frames):
+    # Update every direction smoothly with a bias towards the center
+    direction = update_directions(x, y, direction)
+
+    # Calculate the new positions
+    x += (speed * np.cos(direction)).astype(np.int64)
+    y += (speed * np.sin(direction)).astype(np.int64)
+
+    # Bounce off the borders
+    bounce_x = (x <= brush_size) | (x >= width - brush_size)
+    bounce_y = (y <= brush_size) | (y >= height - brush_size)
+    direction = np.where(bounce_x, np.pi - direction, direction)
+    direction = np.where(bounce_y, -direction, direction)
+
+    # Ensure the brushes stay within bounds
+    np.clip(x, brush_size, width - brush_size, out=x)
+    np.clip(y, brush_size, height - brush_size, out=y)
+
+    # Calculate the color for this frame
+    color = calculate_color(frame_number)
+
+    # Draw every walker and its mirrored segments on the canvas
+    stamps = draw_mirrored_segments(x, y, canvas, color)
+
+    # Write the frame to the video file
+    out.write(canvas)
+
+    # Calculate statistics every second (every 'fps' frames)
+    if frame_number % fps == 0:
+        elapsed_time = time.time() - start_time
+        frames_remaining = total_frames - frame_number
+        time_remaining = (frames_remaining / fps) / 60  # In minutes
+        estimated_finish = time.time() + frames_remaining / fps
+        percentage_complete = (frame_number / total_frames) * 100
+
+        print(f"Time Elapsed: {elapsed_time:.2f} seconds")
+        print(f"Time Remaining: {time_remaining:.2f} minutes")
+        print(f"Estimated Time of Finish: {time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(estimated_finish))}")
+        print(f"Completion: {percentage_complete:.2f}%")
+        print(f"Walkers: {num_walkers}, Stamps: {stamps}\n")
+
+# Release the VideoWriter object
+out.release()
+
+print(f"Video saved as {filename}")
@@ -0,0 +1,231 @@
+import cv2
+import numpy as np
+import os
+import time
+import sys
+
+# Constants
+width, height = 1920, 1080
+fps = 60
+duration_seconds = 60 * 1  # Duration of the video in seconds
+brush_size = 3
+
+# Number of brushes, from the command line; "--preview" shows a half-size window
+# instead of writing a video
+num_brushes = int(sys.argv[1]) if len(sys.argv) > 1 and sys.argv[1].isdigit() else 20000
+preview = "--preview" in sys.argv
+preview_scale = 0.5
+
+# Flocking settings: brushes react to the others within neighbor_radius
+neighbor_radius = 16
+separation_radius = 6
+separation_weight = 4
+alignment_weight = 0.05
+cohesion_weight = 0.005
+center_bias = 0.00002  # Pull towards the center, as in the random walks
+min_speed, max_speed = 1.0, 4.0
+
+# Calculate the total number of frames
+total_frames = fps * duration_seconds
+
+# Center of the canvas
+cx, cy = width // 2, height // 2
+
+# Brush state: positions and velocities of the whole flock
+position = np.column_stack([np.random.uniform(0, width, num_brushes), np.random.uniform(0, height, num_brushes)])
+direction = np.random.uniform(0, 2 * np.pi, num_brushes)  # Random directions in radians
+velocity = np.column_stack([np.cos(direction), np.sin(direction)]) * (min_speed + max_speed) / 2
+
+# Two uniform grids: cells as large as the neighbor radius gather the flock
+# around each brush, cells as large as the separation radius find the brushes
+# that are too close. Every neighbor of a brush is in its own cell or in one of
+# the 8 around it.
+flock_grid = (int(np.ceil(width / neighbor_radius)), int(np.ceil(height / neighbor_radius)), neighbor_radius)
+separation_grid = (int(np.ceil(width / separation_radius)), int(np.ceil(height / separation_radius)), separation_radius)
+cell_offsets = [(dx, dy) for dy in (-1, 0, 1) for dx in (-1, 0, 1)]
+
+# Number of kaleidoscope segments
+num_segments = 8
+
+# Function to calculate smooth color transition
+def calculate_color(frame_number):
+    # Use sine functions to smoothly transition through RGB colors
+    r = int((np.sin(frame_number * 0.02) + 1) * 127.5)
+    g = int((np.sin(frame_number * 0.02 + 2 * np.pi / 3) + 1) * 127.5)
+    b = int((np.sin(frame_number * 0.02 + 4 * np.pi / 3) + 1) * 127.5)
+    return (r, g, b)
+
+# Function to find the cell of every brush in a grid
+def grid_cells(position, grid):
+    grid_columns, grid_rows, cell_size = grid
+    column = np.clip((position[:, 0] // cell_size).astype(np.int64), 0, grid_columns - 1)
+    row = np.clip((position[:, 1] // cell_size).astype(np.int64), 0, grid_rows - 1)
+    return column, row
+
+# Function to list every pair (brush, neighbor) closer than the cell size of a
+# grid. The brushes are sorted by cell, so each cell is a run of that order and
+# only the runs of the 9 cells around each brush are visited.
+def neighbor_pairs(position, grid):
+    grid_columns, grid_rows, cell_size = grid
+    column, row = grid_cells(position, grid)
+    cell = row * grid_columns + column
+    order = np.argsort(cell, kind="stable")
+    counts = np.bincount(cell, minlength=grid_rows * grid_columns)
+    ends = np.cumsum(counts)
+    starts = ends - counts
+
+    brushes, neighbors = [], []
+    for dx, dy in cell_offsets:
+        other_column, other_row = column + dx, row + dy
+        valid = (other_column >= 0) & (other_column < grid_columns) & (other_row >= 0) & (other_row < grid_rows)
+        brush = np.flatnonzero(valid)
+        cell = other_row[brush] * grid_columns + other_column[brush]
+        run = counts[cell]
+
+        # Expand every brush into one entry per brush of the other cell
+        brush = np.repeat(brush, run)
+        first = np.repeat(starts[cell] - np.cumsum(run) + run, run)
+        brushes.append(brush)
+        neighbors.append(order[first + np.arange(len(brush))])
+
+    brush, neighbor = np.concatenate(brushes), np.concatenate(neighbors)
+    offset = position[neighbor] - position[brush]
+    distance_squared = np.einsum("ij,ij->i", offset, offset)
+    close = (distance_squared < cell_size ** 2) & (brush != neighbor)
+    return brush[close], offset[close], distance_squared[close]
+
+# Function to add up some values of the brushes around each brush: the values
+# are summed per cell and then over the 3x3 cells around the brush's cell
+def neighborhood_sums(position, values, grid):
+    grid_columns, grid_rows, cell_size = grid
+    column, row = grid_cells(position, grid)
+    cell = row * grid_columns + column
+    sums = []
+    for value in values:
+        per_cell = np.bincount(cell, weights=value, minlength=grid_rows * grid_columns).reshape(grid_rows, grid_columns)
+        block = cv2.boxFilter(per_cell, -1, (3, 3), normalize=False, borderType=cv2.BORDER_CONSTANT)
+        sums.append(block[row, column] - value)  # Without the brush itself
+    return sums
+
+# Function to advance the flock one frame: separation, alignment and cohesion
+# from the neighbors, a slight pull to the center and a bounce off the borders;
+# returns how many pairs were too close
+def update_flock(position, velocity):
+    # Separation: push away from the brushes that are too close
+    brush, offset, distance_squared = neighbor_pairs(position, separation_grid)
+    push = -offset / np.maximum(distance_squared, 1)[:, None]
+    separation = np.column_stack([np.bincount(brush, weights=push[:, axis], minlength=num_brushes) for axis in (0, 1)])
+
+    # Alignment and cohesion: steer towards the mean velocity and position of the flock around
+    count, x_sum, y_sum, vx_sum, vy_sum = neighborhood_sums(position, [np.ones(num_brushes), position[:, 0], position[:, 1], velocity[:, 0], velocity[:, 1]], flock_grid)
+    has_neighbors = (count > 0.5)[:, None]
+    count = np.maximum(count, 1)[:, None]
+    alignment = np.where(has_neighbors, np.column_stack([vx_sum, vy_sum]) / count - velocity, 0)
+    cohesion = np.where(has_neighbors, np.column_stack([x_sum, y_sum]) / count - position, 0)
+
+    velocity += separation_weight * separation + alignment_weight * alignment + cohesion_weight * cohesion
+    velocity += center_bias * (np.array([cx, cy]) - position)
+
+    # Keep every speed within the limits
+    speed = np.linalg.norm(velocity, axis=1, keepdims=True)
+    velocity *= np.clip(speed, min_speed, max_speed) / np.maximum(speed, 1e-9)
+
+    # Move and bounce off the borders
+    position += velocity
+    for axis, limit in ((0, width), (1, height)):
+        low, high = position[:, axis] < 0, position[:, axis] > limit - 1
+        position[low, axis] = -position[low, axis]
+        position[high, axis] = 2 * (limit - 1) - position[high, axis]
+        velocity[low | high, axis] = -velocity[low | high, axis]
+    return len(brush)
+
+# Function to draw the mirrored segments of every brush in one batch, all in
+# the color of the frame; returns how many stamps landed on the canvas
+def draw_mirrored_segments(position, canvas, color):
+    angles = np.arange(num_segments) * (2 * np.pi / num_segments)
+    dx, dy = (position[:, 0] - cx)[:, None], (position[:, 1] - cy)[:, None]
+    x_rot = ((np.cos(angles) * dx - np.sin(angles) * dy + cx) * scale).astype(np.int64).ravel()
+    y_rot = ((np.sin(angles) * dx + np.cos(angles) * dy + cy) * scale).astype(np.int64).ravel()
+
+    # Mark the centers whose discs can reach the canvas and grow them into discs
+    inside = (x_rot > -stamp_size) & (x_rot < canvas_width + stamp_size) & (y_rot > -stamp_size) & (y_rot < canvas_height + stamp_size)
+    marks[:] = 0
+    marks[y_rot[inside] + stamp_size, x_rot[inside] + stamp_size] = 1
+    cv2.dilate(marks, brush_disc, dst=marks)
+
+    # Paint the frame's color through the covered pixels
+    cv2.rectangle(solid, (0, 0), (canvas_width, canvas_height), color, -1)
+    cv2.copyTo(solid, coverage, canvas)
+    return int(inside.sum())
+
+if preview:
+    # Preview: simulate the whole canvas but draw it smaller and show it in a window
+    scale = preview_scale
+else:
+    scale = 1
+
+    # Create a render directory if it doesn't exist
+    os.makedirs("render", exist_ok=True)
+
+    # Generate the filename using the current epoch time
+    filename = f"render/{int(time.time())}.mp4"
+
+    # Create a VideoWriter object
+    fourcc = cv2.VideoWriter_fourcc(*"mp4v")
+    out = cv2.VideoWriter(filename, fourcc, fps, (width, height))
+
+# Batched stamping as in the independent walkers: the centers are marked on a
+# mask padded by the brush size and dilated by the brush's disc
+canvas_width, canvas_height = int(width * scale), int(height * scale)
+stamp_size = max(1, round(brush_size * scale))
+brush_disc = np.zeros((2 * stamp_size + 1, 2 * stamp_size + 1), dtype=np.uint8)
+cv2.circle(brush_disc, (stamp_size, stamp_size), stamp_size, 1, -1)
+marks = np.zeros((canvas_height + 2 * stamp_size, canvas_width + 2 * stamp_size), dtype=np.uint8)
+coverage = marks[stamp_size:stamp_size + canvas_height, stamp_size:stamp_size + canvas_width]
+solid = np.zeros((canvas_height, canvas_width, 3), dtype=np.uint8)
+
+# Start time of rendering
+start_time = time.time()
+simulation_time = 0
+
+for frame_number in range(total_frames):
+    # Clear the canvas for each frame to remove trails
+    canvas = np.zeros((canvas_height, canvas_width, 3), dtype=np.uint8)
+
+    # Advance the flock
+    simulation_start = time.time()
+    pairs = update_flock(position, velocity)
+    simulation_time += time.time() - simulation_start
+
+    # Draw every brush and its mirrored segments in the color of this frame
+    stamps = draw_mirrored_segments(position, canvas, calculate_color(frame_number))
+
+    if preview:
+        cv2.imshow("bandada", canvas)
+        if cv2.waitKey(1) & 0xFF == ord("q"):
+            break
+    else:
+        # Write the frame to the video file
+        out.write(canvas)
+
+    # Calculate statistics every second (every 'fps' frames)
+    if frame_number % fps == 0:
+        elapsed_time = time.time() - start_time
+        frames_remaining = total_frames - frame_number
+        time_remaining = (frames_remaining / fps) / 60  # In minutes
+        estimated_finish = time.time() + frames_remaining / fps
+        percentage_complete = (frame_number / total_frames) * 100
+
+        print(f"Time Elapsed: {elapsed_time:.2f} seconds")
+        print(f"Time Remaining: {time_remaining:.2f} minutes")
+        print(f"Estimated Time of Finish: {time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(estimated_finish))}")
+        print(f"Completion: {percentage_complete:.2f}%")
+        print(f"Brushes: {num_brushes}, Close Pairs: {pairs}, Stamps: {stamps}, Frames per Second: {(frame_number + 1) / elapsed_time:.1f}, Simulation: {simulation_time / (frame_number + 1) * 1000:.1f} ms per frame\n")
+
+if preview:
+    cv2.destroyAllWindows()
+else:
+    # Release the VideoWriter object
+    out.release()
+
+    print(f"Video saved as {filename}")